@@ -46,7 +46,8 @@ setup(
         "psutil==5.7.0",
         "pygelf==0.3.6",
         "structlog==20.1.0",
-        "graypy==2.1.0"
+        "graypy==2.1.0",
+        "orjson==3.8.14"
     ],
     include_package_data=True,
     zip_safe=False
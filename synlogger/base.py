@@ -5,25 +5,206 @@
 ####################
 
 # Generic/Built-in
+import atexit
+import functools
 import logging
+import os
+import queue
 import sys
-from typing import Callable, List, Tuple
+import threading
+from logging.handlers import QueueHandler, QueueListener
+from typing import Callable, List, Tuple, Type
 
 # Lib
-import graypy
 import structlog
 
 # Custom
 from .abstract import AbstractLogger
-from .config import LOGGING_FORMAT
+from .config import LOG_QUEUE_SIZE, RECORD_FORMAT
 from .utils import StructlogUtils
 
 ##################
 # Configurations #
 ##################
 
-# Monkey patching structlog to support 'notset' level
-structlog.stdlib._LEVEL_TO_NAME[logging.NOTSET] = 'notset'
+# Monkey patching structlog to support 'notset' level (only once, even across
+# module reloads)
+structlog.stdlib._LEVEL_TO_NAME.setdefault(logging.NOTSET, 'notset')
+
+###########
+# Helpers #
+###########
+
+def _cache_by_configuration(maxsize: int = 128) -> Callable:
+    """ Decorator which LRU caches a builder by its configuration, so that
+        loggers of the same configuration share the built objects. The cache
+        is bounded, so that processes creating many loggers of run-specific
+        configurations (e.g. custom filters) do not retain them indefinitely.
+        Configurations with unhashable elements (e.g. callable dataclasses 
+        with `eq=True`) are built without caching.
+
+    Args:
+        maxsize (int): Max no. of configurations cached. Default: 128
+    Returns:
+        Decorator (callable)
+    """
+    def decorator(builder: Callable) -> Callable:
+        cached_builder = functools.lru_cache(maxsize=maxsize)(builder)
+
+        @functools.wraps(builder)
+        def build(*args):
+            try:
+                hash(args)
+            except TypeError:
+                return builder(*args)
+            return cached_builder(*args)
+
+        build.cache_info = cached_builder.cache_info
+        build.cache_clear = cached_builder.cache_clear
+        return build
+
+    return decorator
+
+
+@functools.lru_cache(maxsize=256)
+def _make_formatter(logger_name: str) -> logging.Formatter:
+    """ Retrieves the record formatter for the specified logger, creating it 
+        only once per logger name
+
+    Args:
+        logger_name (str): Logger ID by name e.g. TTP, worker_1, worker_2
+    Returns:
+        Formatter (logging.Formatter)
+    """
+    format = RECORD_FORMAT(name=logger_name)
+    return logging.Formatter(format)
+
+
+@_cache_by_configuration()
+def _get_structlog_utils(
+    censor_keys: Tuple[str], 
+    file_path: str
+) -> StructlogUtils:
+    """ Retrieves the structlog utilities for the specified configuration, 
+        creating them only once per unique configuration
+
+    Args:
+        censor_keys (tuple(str)): Keys whose values are to be censored
+        file_path (str): File location where logging is called
+    Returns:
+        Structlog utilities (StructlogUtils)
+    """
+    return StructlogUtils(censor_keys=list(censor_keys), file_path=file_path)
+
+
+@_cache_by_configuration()
+def _build_processors(
+    logging_variant: str,
+    censor_keys: Tuple[str],
+    file_path: str,
+    filter_functions: Tuple[Callable]
+) -> Tuple[Callable]:
+    """ Assembles a chain of processors to be use as filters during logging.
+        Chains are cached by configuration, so that loggers sharing the same
+        configuration (e.g. across repeated initialisations) reuse the same
+        processor objects instead of rebuilding them.
+
+    Args:
+        logging_variant (str): Type of logging to use
+        censor_keys (tuple(str)): Keys whose values are to be censored
+        file_path (str): File location where logging is called
+        filter_functions (tuple(callable)): Custom filters to be applied
+    Returns:
+        Structlog Processes (tuple(callable))
+    """
+    structlog_utils = _get_structlog_utils(censor_keys, file_path)
+    RENDER_MAP = {
+        'basic': structlog_utils.orjson_renderer, # msg as compact JSON
+        'graylog': structlog_utils.graypy_structlog_processor,
+        'gelf': structlog_utils.gelf_renderer,
+        'test': structlog.testing.LogCapture # only instantiated when used
+    }
+    logging_renderer = RENDER_MAP[logging_variant]
+    if logging_variant == 'test':
+        logging_renderer = logging_renderer()
+
+    ###########################
+    # Implementation Footnote #
+    ###########################
+
+    # [Cause]
+    # In Structlog, a processor is a callable object that executes a 
+    # certain action upon a given event_dict input, and returns an 
+    # augmented event_dict as output. As such, a Structlog processor chain
+    # is formed and parsed in order and sequentially. 
+    #  
+    # eg.
+    # wrapped_logger.msg(
+    #     f4(
+    #         wrapped_logger, "msg",
+    #         f3(
+    #             wrapped_logger, "msg",
+    #             f2(
+    #                 wrapped_logger, "msg",
+    #                 f1(
+    #                     wrapped_logger, "msg", 
+    #                     {"event": "some_event", "x": 42, "y": 23}
+    #                 )
+    #             )
+    #         )
+    #     )
+    # )
+    #
+    # More details on this can be found at:
+    # https://www.structlog.org/en/stable/processors.html?highlight=chain
+
+    # [Problems]
+    # However, for the event_dict to be usable in PyGelf, it has to be
+    # re-casted in a different form, and expressed as args and kwargs. This
+    # means that the custom processor handling PyGelf compatibility will
+    # have an asymmetric output w.r.t other processors, and thus cannot be
+    # used as inputs to a subsequent processor downstream. Doing so results
+    # in `TypeError: 'str' object does not support item assignment`.
+
+    # [Solution]
+    # Ensure that logging renderer is always the last element of the 
+    # processor list (i.e. last unit of the processor chain).
+
+    # Trivial 'basic' & 'gelf' chains are fused into a single processor, 
+    # leaving only the level filter in front so that subclasses can still 
+    # build upon it
+    FUSED_RENDER_MAP = {
+        'basic': structlog_utils.basic_fast_renderer,
+        'gelf': structlog_utils.gelf_fast_renderer
+    }
+    is_trivial = not (censor_keys or filter_functions)
+    if is_trivial and logging_variant in FUSED_RENDER_MAP:
+        return (
+            structlog.stdlib.filter_by_level,
+            FUSED_RENDER_MAP[logging_variant]
+        )
+
+    processors = [
+        structlog.stdlib.filter_by_level, # drop filtered events first!
+        structlog.stdlib.add_logger_name,
+        structlog.stdlib.add_log_level,
+        structlog_utils.add_log_level_number,
+        structlog.stdlib.PositionalArgumentsFormatter(),
+        structlog_utils.format_exc_and_stack_info,
+        structlog_utils.add_cached_timestamp,
+        structlog.processors.UnicodeDecoder(),
+        *filter_functions,      # apply custom filters
+        # Stamping of file path & censoring of sensitive log messages are 
+        # fused into 1 call - 2nd last! Censoring is elided entirely when 
+        # there is nothing to censor
+        (
+            structlog_utils.add_file_path_and_censor 
+            if censor_keys else
+            structlog_utils.get_file_path
+        ),
+        logging_renderer        # IMPT - MUST BE LAST!
+    ]
+    return tuple(processors)
 
 ########################################
 # Organisation Base Class - RootLogger #
@@ -45,9 +226,12 @@ class RootLogger(AbstractLogger):
 
     Attributes:
         logger_name (str): Logger ID by name e.g. TTP, worker_1, worker_2
-        logging_variant: Type of logging to use. There are 2 main options:
+        logging_variant: Type of logging to use. There are 3 main options:
             1. "basic" -> basic logging, 
             2. "graylog" -> logging to graylog server
+            3. "gelf" -> logging to graylog server, with GELF payloads 
+                rendered by the processor chain & sent as-is over TCP
+                (i.e. `transport` does not apply)
             Default: "basic"
         server (str): Host address of the logging server e.g. 127.0.0.1 
             to be specified if logging_variant != 'basic'. Default: None
@@ -63,7 +247,49 @@ class RootLogger(AbstractLogger):
             with the value "*CENSORED*". This protects user-specific 
             secrets. Default: []
         file_path (str): File location where logging is called
+        buffer_capacity (int): No. of GELF records batched into a single send
+            to the Graylog server. Default: 100
+        flush_interval (float): Max no. of seconds a GELF record can remain
+            batched before it is sent to the Graylog server. Default: 1.0
+        transport (str): Network protocol used to reach the Graylog server.
+            There are 2 main options:
+            1. "tcp" -> batched, reliable delivery
+            2. "udp" -> fire-and-forget delivery, which never blocks on
+                acknowledgements, but may silently lose records under network
+                congestion. Only suitable for non-critical/high-volume logs,
+                and requires a GELF UDP input on the Graylog server.
+            Default: "tcp"
+        queue_size (int): Max no. of records held in-memory while awaiting 
+            dispatch to the Graylog server. Default: 10000
+        overflow_level (int): Minimum logging level of records that are 
+            retained when the in-memory queue is full. Records below this level
+            are dropped under backpressure. Default: logging.WARNING
+        context_class (type): Dict-like class used to hold bound context. For
+            multithreaded servers (e.g. TTP), contexts can be kept per-thread
+            via `structlog.threadlocal.wrap_dict(dict)`, while lightweight
+            dict subclasses can cut allocation overheads for loggers with 
+            many bound instances. Default: dict
     """
+    # Connections to remote logging servers, each served by a single handler
+    # behind a background listener, & shared by all loggers of the same setup
+    _connection_pool = {}
+
+    # Attributes determining the connection to the remote logging server
+    _CONNECTION_ATTRIBUTES = (
+        'logging_variant',
+        'transport',
+        'server',
+        'port',
+        'debugging_fields',
+        'buffer_capacity',
+        'flush_interval',
+        'queue_size'
+    )
+
+    # Signatures of the handlers currently attached to each core logger
+    _handler_signatures = {}
+    _init_lock = threading.Lock()
+
     def __init__(
         self, 
         logger_name: str = "std_log", 
@@ -74,7 +300,13 @@ class RootLogger(AbstractLogger):
         debugging_fields: bool = False,
         filter_functions: List[str] = [], 
         censor_keys: list = [],
-        file_path: str = ""
+        file_path: str = "",
+        buffer_capacity: int = 100,
+        flush_interval: float = 1.0,
+        transport: str = "tcp",
+        queue_size: int = LOG_QUEUE_SIZE,
+        overflow_level: int = logging.WARNING,
+        context_class: Type[dict] = dict
     ):
         # General attributes
         # e.g. misc attibutes unique to problem
@@ -88,15 +320,22 @@ class RootLogger(AbstractLogger):
         # e.g. server IP and/or port number
         self.server = server
         self.port = port
+        self.buffer_capacity = buffer_capacity
+        self.flush_interval = flush_interval
+        self.transport = transport
+        self.queue_size = queue_size
+        self.overflow_level = overflow_level
 
         # Data attributes
         # e.g participant_id/run_id in specific format
         self.censor_keys = censor_keys
+        self.context_class = context_class
         self.synlog = None
+        self._utils = _get_structlog_utils(tuple(censor_keys), file_path)
 
         # Optimisation attributes
         # e.g multiprocess/asyncio if necessary for optimisation
-
+        self._init_signature = None
 
         # Export Attributes 
         # e.g. any artifacts that are going to be exported eg Records
@@ -119,85 +358,261 @@ class RootLogger(AbstractLogger):
     # Helpers #
     ###########
 
-    def _configure_processors(self):
-        """ Assembles a list of processors to be use as filters during logging
+    @classmethod
+    def _reopen_connection_pool(cls) -> None:
+        """ Replaces pooled connections inherited from a parent process with
+            fresh ones, since listener threads (& the flushers behind them) do
+            not survive forking. Handlers of loggers initialised in the parent
+            are re-pointed to the fresh connections, so that the child can 
+            keep logging without re-initialising.
+        """
+        cls._init_lock = threading.Lock()
+        inherited_pool, cls._connection_pool = cls._connection_pool, {}
+
+        fresh_queues = {}
+        for connection_signature, stale_listener in inherited_pool.items():
+
+            # Frames still batched belong to the parent, which sends them itself
+            for handler in stale_listener.handlers:
+                if hasattr(handler, 'buffer'):
+                    handler.buffer = []
+
+            connection_owner = cls(**dict(
+                zip(cls._CONNECTION_ATTRIBUTES, connection_signature)
+            ))
+            fresh_queues[stale_listener.queue] = connection_owner._connect()
+
+        for logger_name in cls._handler_signatures:
+            for handler in logging.getLogger(logger_name).handlers:
+                if isinstance(handler, QueueHandler):
+                    handler.queue = fresh_queues.get(
+                        handler.queue, 
+                        handler.queue
+                    )
+
+
+    @classmethod
+    def _close_connection_pool(cls) -> None:
+        """ Stops all pooled listeners of the current process, flushing any
+            pending records to the remote logging server
+        """
+        for listener in list(cls._connection_pool.values()):
+            listener.stop()
+
+
+    @classmethod
+    def _release_connection(cls, connection_signature: tuple) -> None:
+        """ Stops & discards the pooled connection of the specified signature,
+            if no logger is attached to it anymore
+
+        Args:
+            connection_signature (tuple): Signature of the connection released
+        """
+        is_in_use = any(
+            handler_signature[:-1] == connection_signature
+            for handler_signature in cls._handler_signatures.values()
+        )
+        listener = (
+            None if is_in_use else 
+            cls._connection_pool.pop(connection_signature, None)
+        )
+        if listener is not None:
+            listener.stop() # drains pending records into the handler
+            for handler in listener.handlers:
+                handler.close()
+
+
+    def _build_remote_handler(self) -> logging.Handler:
+        """ Builds the handler that performs the actual emission of records to
+            the remote logging server, corresponding to the current logging 
+            variant & transport
 
         Returns:
-            Structlog Processes (list(callable))
+            Network-bound handler (logging.Handler)
+        """
+        # Deferred, so that graypy & its socket machinery are only loaded by
+        # processes that actually log remotely
+        from .handlers import (
+            GELFTCPBatchHandler, 
+            GELFTCPPrerenderedHandler, 
+            GELFUDPTunedHandler
+        )
+
+        if self.logging_variant == 'gelf':
+
+            # Payloads are fully rendered in the processor chain, so debugging
+            # fields are not applicable
+            return GELFTCPPrerenderedHandler(
+                host=self.server, 
+                port=self.port,
+                capacity=self.buffer_capacity,
+                flush_interval=self.flush_interval
+            )
+
+        # `debugging_fields` toggle default debugging fields such as 
+        # "function", "pid", "process_name", "thread_name", etc.
+        if self.transport == 'udp':
+            return GELFUDPTunedHandler(
+                host=self.server, 
+                port=self.port,
+                debugging_fields=self.debugging_fields, 
+                facility="", 
+                level_names=True
+            )
+
+        # Records are batched to cut down on `sendall()` syscalls
+        return GELFTCPBatchHandler(
+            host=self.server, 
+            port=self.port,
+            capacity=self.buffer_capacity,
+            flush_interval=self.flush_interval,
+            debugging_fields=self.debugging_fields, 
+            facility="", 
+            level_names=True
+        )
+
+
+    def _connect(self) -> queue.Queue:
+        """ Retrieves the queue feeding the pooled connection to the remote 
+            logging server, opening the connection only if no other logger of
+            the same setup has done so. Each connection is drained by a single
+            background listener, so that loggers sharing a server do not each
+            hold their own socket & thread.
+
+        Returns:
+            Queue of records awaiting dispatch (queue.Queue)
+        """
+        connection_signature = self._get_connection_signature()
+        listener = RootLogger._connection_pool.get(connection_signature)
+        if listener is None:
+            listener = QueueListener(
+                queue.Queue(maxsize=self.queue_size), 
+                self._build_remote_handler(), 
+                respect_handler_level=True
+            )
+            listener.start()
+            RootLogger._connection_pool[connection_signature] = listener
+
+        return listener.queue
+
+
+    def _get_connection_signature(self) -> tuple:
+        """ Summarises all attributes that determine the connection to the 
+            remote logging server, so that it can be shared by loggers of 
+            identical setups
+
+        Returns:
+            Connection signature (tuple)
         """
-        structlog_utils = StructlogUtils(
-            censor_keys=self.censor_keys,
-            file_path=self.file_path
+        return tuple(
+            getattr(self, attribute) 
+            for attribute in RootLogger._CONNECTION_ATTRIBUTES
         )
-        RENDER_MAP = {
-            'basic': structlog.processors.JSONRenderer(indent=1), # msg as dict
-            'graylog': structlog_utils.graypy_structlog_processor,
-            'test': structlog.testing.LogCapture()
-        }
-        censor_logging = structlog_utils.censor_logging
-        get_file_path = structlog_utils.get_file_path
-        add_timestamp = structlog_utils.add_timestamp
-        logging_renderer = RENDER_MAP[self.logging_variant]
 
+
+    def _get_processors_signature(self) -> tuple:
+        """ Summarises all attributes that determine the processor chain of the
+            logger (i.e. the key under which chains are cached)
+
+        Returns:
+            Processors signature (tuple)
+        """
+        return (
+            self.logging_variant,
+            tuple(self.censor_keys),
+            self.file_path,
+            tuple(self.filter_functions)
+        )
+
+
+    def _get_init_signature(self) -> tuple:
+        """ Summarises all attributes that determine the initialised logger, so
+            that repeated initialisations of an unchanged setup can be detected
+
+        Returns:
+            Initialisation signature (tuple)
+        """
+        return (
+            self._get_processors_signature(),
+            self._get_handler_signature(),
+            self.logging_level,
+            self.context_class
+        )
+
+
+    def _get_handler_signature(self) -> tuple:
+        """ Summarises all attributes that determine the handler attached to 
+            the core logger, so that identical setups can be detected
+
+        Returns:
+            Handler signature (tuple)
+        """
+        return self._get_connection_signature() + (self.overflow_level,)
+
+
+    def _attach_handler(self, core_logger: logging.Logger) -> None:
+        """ Builds the handler corresponding to the current logging variant, and
+            attaches it to the specified core logger as its sole handler
+
+        Args:
+            core_logger (logging.Logger): Stdlib logger to be wrapped
+        """
         ###########################
         # Implementation Footnote #
         ###########################
 
         # [Cause]
-        # In Structlog, a processor is a callable object that executes a 
-        # certain action upon a given event_dict input, and returns an 
-        # augmented event_dict as output. As such, a Structlog processor chain
-        # is formed and parsed in order and sequentially. 
-        #  
-        # eg.
-        # wrapped_logger.msg(
-        #     f4(
-        #         wrapped_logger, "msg",
-        #         f3(
-        #             wrapped_logger, "msg",
-        #             f2(
-        #                 wrapped_logger, "msg",
-        #                 f1(
-        #                     wrapped_logger, "msg", 
-        #                     {"event": "some_event", "x": 42, "y": 23}
-        #                 )
-        #             )
-        #         )
-        #     )
-        # )
-        #
-        # More details on this can be found at:
-        # https://www.structlog.org/en/stable/processors.html?highlight=chain
+        # When adding handlers to logging.Logger, handlers get appended to an
+        # existing pool of handlers.
 
         # [Problems]
-        # However, for the event_dict to be usable in PyGelf, it has to be
-        # re-casted in a different form, and expressed as args and kwargs. This
-        # means that the custom processor handling PyGelf compatibility will
-        # have an asymmetric output w.r.t other processors, and thus cannot be
-        # used as inputs to a subsequent processor downstream. Doing so results
-        # in `TypeError: 'str' object does not support item assignment`.
+        # Blindly appending handlers will result in multiple handlers cached,
+        # which results in duplicated logging entries. Calling `.initialise()`
+        # thus fails to be idempotent.
 
         # [Solution]
-        # Ensure that logging renderer is always the last element of the 
-        # processor list (i.e. last unit of the processor chain).
+        # Clear all handlers under logger first before initialisation.
 
-        processors = [
-            structlog.stdlib.add_logger_name,
-            structlog.stdlib.add_log_level,
-            structlog.stdlib.add_log_level_number,
-            structlog.stdlib.filter_by_level,
-            structlog.stdlib.PositionalArgumentsFormatter(),
-            structlog.processors.format_exc_info,
-            structlog.processors.TimeStamper(fmt="%Y-%m-%d %H:%M.%S"),
-            structlog.processors.StackInfoRenderer(), 
-            structlog.processors.UnicodeDecoder(),
-            *self.filter_functions, # apply custom filters
-            get_file_path,
-            censor_logging,         # censor sensitive log messages - 2nd last!
-            logging_renderer        # IMPT - MUST BE LAST!
-        ]
-
-        return processors
+        if core_logger.hasHandlers():
+            core_logger.handlers.clear()
+
+        if self.logging_variant in ('graylog', 'gelf'):
+
+            # Network I/O is kept off the caller's thread, with records queued
+            # onto the pooled connection shared with other loggers. Should the
+            # server stall, low-severity records are shed to bound memory.
+            from .handlers import OverflowQueueHandler
+            handler = OverflowQueueHandler(
+                self._connect(), 
+                overflow_level=self.overflow_level
+            )
+
+            # Pre-rendered GELF payloads must be left untouched
+            if self.logging_variant == 'graylog':
+                handler.setFormatter(_make_formatter(self.logger_name))
+
+        else:
+            # handler = logging.StreamHandler(stream=sys.stdout)
+            handler = logging.NullHandler()
+            handler.setFormatter(_make_formatter(self.logger_name))
+
+        core_logger.addHandler(handler)
+
+
+    def _configure_processors(self):
+        """ Assembles a list of processors to be use as filters during logging
+
+        Returns:
+            Structlog Processes (list(callable))
+        """
+        # `LogCapture` accumulates entries, so it must never be shared
+        build = (
+            _build_processors.__wrapped__ 
+            if self.logging_variant == 'test' 
+            else _build_processors
+        )
+        processors = build(*self._get_processors_signature())
+        return list(processors)
 
     ##################
     # Core Functions #
@@ -216,54 +631,55 @@ class RootLogger(AbstractLogger):
             }
 
         Args:
-            kwargs: Miscellaneous values for compatibility
+            kwargs: Miscellaneous values for compatibility. Censor keys can 
+                still be declared here (i.e. `censor_keys`), although 
+                declaring them in `__init__` is preferred.
         Returns:
             syn_logger: A structlog + Pygelf logger
         """
+        if 'censor_keys' in kwargs:
+            self.censor_keys = kwargs['censor_keys']
+            self._utils = _get_structlog_utils(
+                tuple(self.censor_keys), 
+                self.file_path
+            )
+
+        # Repeated initialisations of an unchanged setup are no-ops, unless its
+        # handlers have since been discarded (e.g. after forking)
+        init_signature = self._get_init_signature()
+        handler_signature = self._get_handler_signature()
+        is_unchanged = (
+            init_signature == self._init_signature and
+            RootLogger._handler_signatures.get(self.logger_name) == 
+            handler_signature
+        )
+        if self.is_initialised() and is_unchanged:
+            return self.synlog
+
         core_logger = logging.getLogger(self.logger_name) 
         core_logger.setLevel(level=self.logging_level)
 
-        if not self.is_initialised():
-
-            ###########################
-            # Implementation Footnote #
-            ###########################
-
-            # [Cause]
-            # When adding handlers to logging.Logger, handlers get appended to an
-            # existing pool of handlers.
-
-            # [Problems]
-            # Blindly appending handlers will result in multiple handlers cached,
-            # which results in duplicated logging entries. Calling `.initialise()`
-            # thus fails to be idempotent.
-
-            # [Solution]
-            # Clear all handlers under logger first before initialisation.
-
-            if core_logger.hasHandlers():
-                core_logger.handlers.clear()
-
-            if self.logging_variant == 'graylog':
-                
-                # `debugging_fields` toggle default debugging fields such as 
-                # "function", "pid", "process_name", "thread_name", etc.
-                handler = graypy.GELFTCPHandler(
-                    host=self.server, 
-                    port=self.port,
-                    debugging_fields=self.debugging_fields, 
-                    facility="", 
-                    level_names=True
+        with RootLogger._init_lock:
+
+            # Handlers are only rebuilt when the existing ones differ, to avoid
+            # needlessly tearing down sockets & listener threads
+            is_attached = (
+                bool(core_logger.handlers) and
+                RootLogger._handler_signatures.get(self.logger_name) == 
+                handler_signature
+            )
+            if not is_attached:
+                prev_signature = RootLogger._handler_signatures.get(
+                    self.logger_name
+                )
+                self._attach_handler(core_logger)
+                RootLogger._handler_signatures[self.logger_name] = (
+                    handler_signature
                 )
 
-            else:
-                # handler = logging.StreamHandler(stream=sys.stdout)
-                handler = logging.NullHandler()
-
-            format = LOGGING_FORMAT.safe_substitute({'name': self.logger_name})
-            formatter = logging.Formatter(format)
-            handler.setFormatter(formatter)
-            core_logger.addHandler(handler) 
+                # Superseded connections must not leak their threads & sockets
+                if prev_signature and prev_signature != handler_signature:
+                    RootLogger._release_connection(prev_signature[:-1])
 
         # Allows for dynamic reconfiguration for filtering processors
         processors = self._configure_processors()
@@ -271,11 +687,17 @@ class RootLogger(AbstractLogger):
             logger=core_logger,
             processors=processors,
             wrapper_class=structlog.stdlib.BoundLogger,
-            context_class=dict,
+            context_class=self.context_class,
             cache_logger_on_first_use=True
         )
 
         self.synlog = sys_logger
+        self._init_signature = init_signature
 
         return self.synlog
 
+
+# Pending records are flushed on shutdown, while connections inherited across
+# forks are reopened (i.e. their listeners are dead in the child)
+atexit.register(RootLogger._close_connection_pool)
+os.register_at_fork(after_in_child=RootLogger._reopen_connection_pool)
@@ -18,6 +18,20 @@ from string import Template
 ##################
 
 LOGGING_FORMAT = Template("[$name] %(message)s")
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M.%S"
+
+# Bound `str.format` equivalent of LOGGING_FORMAT, used internally to avoid 
+# Template's regex-driven substitution
+# e.g. RECORD_FORMAT(name="abc") -> "[abc] %(message)s"
+RECORD_FORMAT = "[{name}] %(message)s".format
+
+# Maximum no. of records held in-memory while awaiting dispatch to Graylog
+LOG_QUEUE_SIZE = 10000
+
+# Min. no. of seconds between successive DiskIO & NetworkIO snapshots taken by
+# sysmetric trackers. Such counters are costlier to read & change slowly, so 
+# they are polled less often than CPU & memory statistics.
+IO_COUNTERS_RESOLUTION = 1.0
 
 # Default string used to censor sensitive values
 CENSOR = "*CENSORED*"
@@ -34,6 +48,14 @@ TTP_NAME_TEMPLATE = Template(f"{TTP_PREFIX}_$name")
 WORKER_NAME_TEMPLATE = Template(f"{WORKER_PREFIX}_$name")
 SYSMETRICS_NAME_TEMPLATE = Template(f"{SYSMETRICS_PREFIX}_$name")
 
+# Bound `str.format` equivalents of the logger templates, used internally. 
+# Prefixes are baked in beforehand, so each is a plain `str.format` call 
+# e.g. DIRECTOR_NAME_FORMAT(name="abc") -> "DIR_abc"
+DIRECTOR_NAME_FORMAT = f"{DIRECTOR_PREFIX}_{{name}}".format
+TTP_NAME_FORMAT = f"{TTP_PREFIX}_{{name}}".format
+WORKER_NAME_FORMAT = f"{WORKER_PREFIX}_{{name}}".format
+SYSMETRICS_NAME_FORMAT = f"{SYSMETRICS_PREFIX}_{{name}}".format
+
 # Default logging ports to be created in the graylog server. All logs from 
 # multiple target types will be matched to a single port i.e. all workers nodes
 # will publish to the allocated WORKER_PORT.
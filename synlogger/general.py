@@ -5,92 +5,97 @@
 ####################
 
 # Generic/Built-in
+import asyncio
+import concurrent.futures
 import logging
-import signal
+import os
 import sys
-import time
-from multiprocessing import Process
-from typing import Dict, List
+import threading
+from typing import Dict, List, Type
 
 # Lib
-
+import structlog
 
 # Custom
 from .base import RootLogger
 from .config import (
-    DIRECTOR_NAME_TEMPLATE, 
-    TTP_NAME_TEMPLATE, 
-    WORKER_NAME_TEMPLATE, 
-    SYSMETRICS_NAME_TEMPLATE,
+    DIRECTOR_NAME_FORMAT, 
+    TTP_NAME_FORMAT, 
+    WORKER_NAME_FORMAT, 
+    SYSMETRICS_NAME_FORMAT,
+    LOG_QUEUE_SIZE,
     SYSMETRICS_PORT, 
     DIRECTOR_PORT, 
     TTP_PORT, 
     WORKER_PORT
 )
-from .utils import StructlogUtils
+from .utils import start_cpu_sampler
 
 ##################
 # Configurations #
 ##################
 
+# Event loop hosting all sysmetric trackers of the current process
+_tracking_loop = None
+_tracking_loop_lock = threading.Lock()
 
-############################################
-# Organisation Core Class - DirectorLogger #
-############################################
-
-class DirectorLogger(RootLogger):
-
-    def __init__(
-        self, 
-        logger_name: str,
-        logging_variant: str = "basic",
-        server: str = None,
-        port: int = None,
-        logging_level: int = logging.INFO, 
-        debugging_fields: bool = False,
-        filter_functions: List[str] = [], 
-        censor_keys: list = [],
-        file_path: str = ""
-    ):
-        # General attributes
-        # e.g. misc attibutes unique to problem
-
-
-        # Network attributes
-        # e.g. server IP and/or port number
-        PORT = port if port else DIRECTOR_PORT 
+# Max no. of seconds to wait for a tracking task to wind down upon termination
+# (e.g. its loop may no longer be running, if the tracker was inherited across
+# a fork)
+TERMINATION_TIMEOUT = 5.0
 
-        # Data attributes
-        # e.g participant_id/run_id in specific format
-        NODE_NAME = DIRECTOR_NAME_TEMPLATE.safe_substitute(name=logger_name)
+###########
+# Helpers #
+###########
 
-        # Optimisation attributes
-        # e.g multiprocess/asyncio if necessary for optimisation
-
-
-        # Export Attributes 
-        # e.g. any artifacts that are going to be exported eg Records
-    
+def _reset_tracking_loop() -> None:
+    """ Discards the tracking loop inherited from a parent process, since the
+        thread running it does not survive forking
+    """
+    global _tracking_loop, _tracking_loop_lock
+    _tracking_loop = None
+    _tracking_loop_lock = threading.Lock()
 
-        super().__init__(
-            server=server, 
-            port=PORT, 
-            logger_name=NODE_NAME, 
-            logging_level=logging_level, 
-            logging_variant=logging_variant, 
-            debugging_fields=debugging_fields, 
-            filter_functions=filter_functions, 
-            censor_keys=censor_keys,
-            file_path=file_path
-        )
+os.register_at_fork(after_in_child=_reset_tracking_loop)
 
 
+def _get_tracking_loop() -> asyncio.AbstractEventLoop:
+    """ Retrieves the event loop hosting sysmetric trackers, starting it in a
+        background daemon thread if necessary. All trackers of the process 
+        share this single loop, so that tracking is just a sleeping task 
+        instead of a dedicated process.
 
-#######################################
-# Organisation Core Class - TTPLogger #
-#######################################
+    Returns:
+        Tracking event loop (asyncio.AbstractEventLoop)
+    """
+    global _tracking_loop
+    with _tracking_loop_lock:
+        if _tracking_loop is None:
+            _tracking_loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=_tracking_loop.run_forever, 
+                daemon=True
+            ).start()
+    return _tracking_loop
+
+
+########################################
+# Organisation Base Class - RoleLogger #
+########################################
+
+class RoleLogger(RootLogger):
+    """
+    Base class for loggers of a specific Synergos role. Roles differ only in 
+    the prefix used in their logger names, and the default port they publish
+    to on the logging server, as declared by the following class attributes:
 
-class TTPLogger(RootLogger):
+    Attributes:
+        NAME_FORMAT (callable): Formats a logger name into a role-specific 
+            logger name e.g. DIRECTOR_NAME_FORMAT
+        DEFAULT_PORT (int): Port to publish to if no port is specified
+    """
+    NAME_FORMAT = "{name}".format
+    DEFAULT_PORT = None
 
     def __init__(
         self, 
@@ -102,7 +107,13 @@ class TTPLogger(RootLogger):
         debugging_fields: bool = False,
         filter_functions: List[str] = [], 
         censor_keys: list = [],
-        file_path: str = ""
+        file_path: str = "",
+        buffer_capacity: int = 100,
+        flush_interval: float = 1.0,
+        transport: str = "tcp",
+        queue_size: int = LOG_QUEUE_SIZE,
+        overflow_level: int = logging.WARNING,
+        context_class: Type[dict] = dict
     ):
         # General attributes
         # e.g. misc attibutes unique to problem
@@ -110,11 +121,12 @@ class TTPLogger(RootLogger):
 
         # Network attributes
         # e.g. server IP and/or port number
-        PORT = port if port else TTP_PORT 
+        PORT = port if port else self.DEFAULT_PORT
 
         # Data attributes
         # e.g participant_id/run_id in specific format
-        NODE_NAME = TTP_NAME_TEMPLATE.safe_substitute(name=logger_name)
+        # Names are interned, since they key various logger & handler caches
+        NODE_NAME = sys.intern(self.NAME_FORMAT(name=logger_name))
 
         # Optimisation attributes
         # e.g multiprocess/asyncio if necessary for optimisation
@@ -133,60 +145,44 @@ class TTPLogger(RootLogger):
             debugging_fields=debugging_fields, 
             filter_functions=filter_functions, 
             censor_keys=censor_keys,
-            file_path=file_path
+            file_path=file_path,
+            buffer_capacity=buffer_capacity,
+            flush_interval=flush_interval,
+            transport=transport,
+            queue_size=queue_size,
+            overflow_level=overflow_level,
+            context_class=context_class
         )
 
 
 
-##########################################
-# Organisation Core Class - WorkerLogger #
-##########################################
+############################################
+# Organisation Core Class - DirectorLogger #
+############################################
 
-class WorkerLogger(RootLogger):
+class DirectorLogger(RoleLogger):
+    NAME_FORMAT = DIRECTOR_NAME_FORMAT
+    DEFAULT_PORT = DIRECTOR_PORT
 
-    def __init__(
-        self, 
-        logger_name: str,
-        logging_variant: str = "basic",
-        server: str = None,
-        port: int = None,
-        logging_level: int = logging.INFO, 
-        debugging_fields: bool = False,
-        filter_functions: List[str] = [], 
-        censor_keys: list = [],
-        file_path: str = "",
-    ):
-        # General attributes
-        # e.g. misc attibutes unique to problem
 
 
-        # Network attributes
-        # e.g. server IP and/or port number
-        PORT = port if port else WORKER_PORT
-
-        # Data attributes
-        # e.g participant_id/run_id in specific format
-        NODE_NAME = WORKER_NAME_TEMPLATE.safe_substitute(name=logger_name)
+#######################################
+# Organisation Core Class - TTPLogger #
+#######################################
 
-        # Optimisation attributes
-        # e.g multiprocess/asyncio if necessary for optimisation
+class TTPLogger(RoleLogger):
+    NAME_FORMAT = TTP_NAME_FORMAT
+    DEFAULT_PORT = TTP_PORT
 
 
-        # Export Attributes 
-        # e.g. any artifacts that are going to be exported eg Records
 
+##########################################
+# Organisation Core Class - WorkerLogger #
+##########################################
 
-        super().__init__(
-            server=server, 
-            port=PORT, 
-            logger_name=NODE_NAME, 
-            logging_level=logging_level, 
-            logging_variant=logging_variant, 
-            debugging_fields=debugging_fields, 
-            filter_functions=filter_functions, 
-            censor_keys=censor_keys,
-            file_path=file_path
-        )
+class WorkerLogger(RoleLogger):
+    NAME_FORMAT = WORKER_NAME_FORMAT
+    DEFAULT_PORT = WORKER_PORT
 
 
 
@@ -194,7 +190,7 @@ class WorkerLogger(RootLogger):
 # Organisation Core Class - SysmetricLogger #
 #############################################
 
-class SysmetricLogger(RootLogger):
+class SysmetricLogger(RoleLogger):
     """
     initialise configuration for setting up a logging server using structlog
 
@@ -208,7 +204,14 @@ class SysmetricLogger(RootLogger):
             1. "default" -> basic logging, 
             2. "graylog" -> logging to graylog server
             Default: "default"
+        buffer_capacity (int): No. of probe records batched into a single send
+            to the Graylog server. Default: 64
+        flush_interval (float): Max no. of seconds a probe record can remain
+            batched before it is sent to the Graylog server. Default: 0.5
     """
+    NAME_FORMAT = SYSMETRICS_NAME_FORMAT
+    DEFAULT_PORT = SYSMETRICS_PORT
+
     def __init__(
         self, 
         logger_name: str,
@@ -220,6 +223,12 @@ class SysmetricLogger(RootLogger):
         filter_functions: List[str] = [], 
         censor_keys: list = [],
         file_path: str = "",
+        buffer_capacity: int = 64,
+        flush_interval: float = 0.5,
+        transport: str = "tcp",
+        queue_size: int = LOG_QUEUE_SIZE,
+        overflow_level: int = logging.WARNING,
+        context_class: Type[dict] = dict
     ):
         # General attributes
         # e.g. misc attibutes unique to problem
@@ -227,15 +236,16 @@ class SysmetricLogger(RootLogger):
 
         # Network attributes
         # e.g. server IP and/or port number
-        PORT = port if port else SYSMETRICS_PORT
+
 
         # Data attributes
         # e.g participant_id/run_id in specific format
-        NODE_NAME = SYSMETRICS_NAME_TEMPLATE.safe_substitute(name=logger_name)
+
 
         # Optimisation attributes
         # e.g multiprocess/asyncio if necessary for optimisation
         self.tracker = None
+        self._stop = None # signals the tracking task to wind down
 
         # Export Attributes 
         # e.g. any artifacts that are going to be exported eg Records
@@ -243,14 +253,20 @@ class SysmetricLogger(RootLogger):
 
         super().__init__(
             server=server, 
-            port=PORT, 
-            logger_name=NODE_NAME, 
+            port=port, 
+            logger_name=logger_name, 
             logging_level=logging_level, 
             logging_variant=logging_variant, 
             debugging_fields=debugging_fields, 
             filter_functions=filter_functions, 
             censor_keys=censor_keys,
-            file_path=file_path
+            file_path=file_path,
+            buffer_capacity=buffer_capacity,
+            flush_interval=flush_interval,
+            transport=transport,
+            queue_size=queue_size,
+            overflow_level=overflow_level,
+            context_class=context_class
         )
 
     ############    
@@ -258,12 +274,14 @@ class SysmetricLogger(RootLogger):
     ############
 
     def is_tracking(self) -> bool:
-        """ Checks if logger is currently tracking to enforce idempotence
+        """ Checks if logger is currently tracking to enforce idempotence. A
+            tracking task that has since died (e.g. due to a failed probe) is 
+            not considered to be tracking.
 
         Returns:
             State (bool)
         """
-        return self.tracker is not None
+        return self.tracker is not None and not self.tracker.done()
 
     ###########
     # Helpers #
@@ -278,15 +296,7 @@ class SysmetricLogger(RootLogger):
         Returns:
             Structlog Processes (list(callable))
         """
-        structlog_utils = StructlogUtils(
-            censor_keys=self.censor_keys, 
-            file_path=self.file_path
-        )
-
-        track_cpu_stats = structlog_utils.track_cpu_stats
-        track_memory_stats = structlog_utils.track_memory_stats
-        track_disk_stats = structlog_utils.track_disk_stats
-        track_network_stats = structlog_utils.track_network_stats
+        track_system_stats = self._utils.track_system_stats
 
         ###########################
         # Implementation Footnote #
@@ -328,43 +338,22 @@ class SysmetricLogger(RootLogger):
         # [Solution]
         # Ensure that generic processors procured from the parent class are
         # ALWAYS appended at the back of the processor list, ensuring that the
-        # custom PyGelf processor is ALWAYS the final processor executed.
-
-        generic_processors = super()._configure_processors()
-        hardware_processors = [
-            track_cpu_stats,
-            track_memory_stats,
-            track_disk_stats,
-            track_network_stats
-        ]
-        all_processors = hardware_processors + generic_processors
+        # custom PyGelf processor is ALWAYS the final processor executed. The
+        # exception is the level filter leading the generic processors, which
+        # is kept in front so that filtered events never trigger psutil probes.
+
+        level_filter, *generic_processors = super()._configure_processors()
+        hardware_processors = [track_system_stats] # all stats in 1 pass
+        all_processors = [level_filter] + hardware_processors + generic_processors
         
         return all_processors
 
 
-    def _exit(self, signnum: str, frame) -> None:
-        """ Exit signal to terminate system tracking
-
-        Args:
-            signame (str): Signal recieved
-        """
-        signame = signal.Signals(signnum).name
-        self.synlog.info(
-            f"Signal {signame} of code {signnum} on {frame} has been received.",
-            signame=signame,
-            signnum=signnum
-        )        
-
-        # Zero is considered “successful termination” and any nonzero value is 
-        # considered “abnormal termination” by shells and the like.
-        self.synlog.info("Sysmetric operations stopped.")
-        sys.exit(0)
-
-
-    def _probe(
+    async def _probe(
         self,
         resolution: int = 1,
         descriptors: Dict[str, str] = {},
+        probe_logger: structlog.stdlib.BoundLogger = None
     ) -> None:
         """ Polls and logs hardware statistics in the background at a specified
             regular interval. Current statistics supported include:
@@ -386,13 +375,24 @@ class SysmetricLogger(RootLogger):
             resolution (int): Polling interval in seconds. Default: 1
             descriptors (dict(str, str)): Localisation descriptors identifying
                 the current running source code segment. Default: {}
+            probe_logger (structlog.stdlib.BoundLogger): Logger with the 
+                resolution & descriptors already bound, so that repeated 
+                probes need not re-merge them. Default: None
         """
-        self.synlog.info(
-            "Probed system's hardware usage successfully.", 
-            resolution=resolution,
-            **descriptors
-        )
-        time.sleep(resolution)
+        if probe_logger is None:
+            probe_logger = self.synlog.bind(resolution=resolution, **descriptors)
+        probe_logger.info("Probed system's hardware usage successfully.")
+
+        # Waiting on the stop signal doubles as the polling interval, so that
+        # termination takes effect immediately instead of after a full sleep
+        if self._stop is None:
+            await asyncio.sleep(resolution) # not tracking; nothing to stop
+            return
+
+        try:
+            await asyncio.wait_for(self._stop.wait(), timeout=resolution)
+        except asyncio.TimeoutError:
+            pass
 
     ##################
     # Core Functions #
@@ -405,33 +405,50 @@ class SysmetricLogger(RootLogger):
         function_name: str,
         resolution: int = 1,
         **kwargs
-    ):
+    ) -> asyncio.Task:
         """ Commences periodic polling and logging of hardware stats of the 
-            current system.
+            current system. Polling runs as a task on a shared background event
+            loop, within the current process.
 
         Args:
             component: Synergos component either TTP or Worker for the 
                 HardwareStatsLogger, config.TTP or config.WORKER
             file_path: The location of the file path that call this function
         Returns:
-            Process (subprocess.Popen object)
+            Tracking task (asyncio.Task)
         """
         
-        def target(descriptors: Dict[str, str]) -> None:
+        async def target(descriptors: Dict[str, str]) -> None:
             """ Triggers periodic probe for hardware statistics, incorporating
                 custom localisation descriptors into the logs
 
             Args:
                 descriptors (dict(str, str)):
             """
-            # Terminate process when one of the following signal is received
-            DEFAULT_SIGNALS = ('SIGINT', 'SIGTERM')
-            for signame in DEFAULT_SIGNALS:
-                signal_code = getattr(signal, signame)
-                signal.signal(signal_code, self._exit)
+            # CPU utilisation is sampled at the same cadence as probing
+            start_cpu_sampler(resolution=resolution)
+
+            # Context is bound once for the lifetime of the tracker
+            probe_logger = self.synlog.bind(
+                resolution=resolution, 
+                **descriptors
+            )
+            while not self._stop.is_set():
+                await self._probe(
+                    resolution=resolution, 
+                    probe_logger=probe_logger
+                )
+
+        async def spawn(descriptors: Dict[str, str]) -> asyncio.Task:
+            """ Schedules the periodic probe as a task on the tracking loop
 
-            while True:
-                self._probe(resolution=resolution, descriptors=descriptors)
+            Args:
+                descriptors (dict(str, str)):
+            Returns:
+                Tracking task (asyncio.Task)
+            """
+            self._stop = asyncio.Event()
+            return asyncio.get_running_loop().create_task(target(descriptors))
 
         if not self.is_tracking():
             self.initialise()
@@ -443,19 +460,23 @@ class SysmetricLogger(RootLogger):
                 **kwargs
             }
 
-            self.tracker = Process(target=target, args=(descriptors,))
-            self.tracker.daemon = True
-            self.tracker.start()
+            self.tracker = asyncio.run_coroutine_threadsafe(
+                spawn(descriptors), 
+                _get_tracking_loop()
+            ).result()
 
         return self.tracker
 
 
     def terminate(self) -> int:
-        """ Terminate the hardware monitoring process. An exit code is returned
+        """ Terminate the hardware monitoring task. An exit code is returned
             in accordance to the following rules:
-            1) If previously tracking, return terminated process ID.
-                a) if sucessful, exit_code == 0
-                b) Otherwise, exit_code > 0
+            1) If previously tracking (incl. tracking tasks that have since
+                died), return the tracking task's exit code.
+                a) if sucessfully stopped, exit_code == 0
+                b) Otherwise, exit_code > 0 i.e. 1 if the task failed or was
+                    cancelled, 2 if it did not wind down within 
+                    TERMINATION_TIMEOUT seconds
             2) Otherwise, return -42
 
         Returns:
@@ -466,15 +487,54 @@ class SysmetricLogger(RootLogger):
 
         exit_code = -42
 
-        if self.is_tracking():
-            # Sending the SIGTERM signal to the child
-            self.tracker.terminate()
-            self.tracker.join()
-            exit_code = self.tracker.exitcode
+        # Dead tracking tasks are still terminated, to surface their failures
+        if self.tracker is not None:
+
+            async def stop(tracker: asyncio.Task) -> int:
+                """ Signals the tracking task to stop after its current probe, 
+                    & waits for it to wind down
+
+                Args:
+                    tracker (asyncio.Task): Tracking task to be stopped
+                Returns:
+                    Exit code (int)
+                """
+                self._stop.set()
+                try:
+                    await tracker
+
+                # Cancellation is not an `Exception` from Python 3.8 onwards
+                except asyncio.CancelledError:
+                    return 1
+
+                except Exception as exception:
+                    self.synlog.error(
+                        f"Tracking failed with {type(exception).__name__}",
+                        exc_info=(
+                            type(exception), 
+                            exception, 
+                            exception.__traceback__
+                        )
+                    )
+                    return 1
+                return 0
+
+            stopping = asyncio.run_coroutine_threadsafe(
+                stop(self.tracker), 
+                self.tracker.get_loop()
+            )
+            try:
+                exit_code = stopping.result(timeout=TERMINATION_TIMEOUT)
+            except concurrent.futures.TimeoutError:
+                stopping.cancel()
+                self.tracker.get_loop().call_soon_threadsafe(
+                    self.tracker.cancel
+                )
+                exit_code = 2
 
             # Reset state of tracker
-            self.tracker.close()
             self.tracker = None
+            self._stop = None
 
             self.synlog.info(f"Tracking terminated with exit code {exit_code}")
 
@@ -0,0 +1,366 @@
+#!/usr/bin/env python
+
+####################
+# Required Modules #
+####################
+
+# Generic/Built-in
+import logging
+import queue
+import socket
+import threading
+from logging.handlers import QueueHandler
+
+# Lib
+import graypy
+import orjson
+
+# Custom
+from .utils import orjson_default
+
+##################
+# Configurations #
+##################
+
+
+##############################################
+# Organisation Mixin Class - OrjsonGELFMixin #
+##############################################
+
+class OrjsonGELFMixin:
+    """
+    Mixin for graypy handlers, which serialises GELF dictionaries with orjson's
+    C extension instead of the stdlib `json` module. Byte strings are decoded,
+    while unsupported objects are represented by their repr, as per graypy.
+    """
+
+    ##################
+    # Core Functions #
+    ##################
+
+    @classmethod
+    def _pack_gelf_dict(cls, gelf_dict: dict) -> bytes:
+        """ Converts a GELF dictionary into JSON-encoded UTF-8 bytes
+
+        Args:
+            gelf_dict (dict): Dictionary representing a GELF log
+        Returns:
+            Uncompressed GELF log (bytes)
+        """
+        return orjson.dumps(
+            gelf_dict, 
+            default=orjson_default, 
+            option=orjson.OPT_NON_STR_KEYS
+        )
+
+
+
+####################################################
+# Organisation Handler Class - GELFTCPBatchHandler #
+####################################################
+
+class GELFTCPBatchHandler(OrjsonGELFMixin, graypy.GELFTCPHandler):
+    """
+    GELF TCP handler that accumulates null-terminated GELF frames in memory,
+    and dispatches them to Graylog with a single `sendall()`. A flush is
+    triggered when:
+        1. The buffer reaches `capacity` frames
+        2. A record of `flush_level` or higher is received
+        3. `flush_interval` seconds have lapsed (for low-volume loggers)
+
+    Attributes:
+        host (str): Host address of the Graylog server e.g. 127.0.0.1
+        port (int): Port of the Graylog GELF TCP input e.g. 9300
+        capacity (int): Max no. of frames buffered before a flush is forced.
+            Default: 100
+        flush_level (int): Minimum logging level that forces an immediate
+            flush. Default: logging.ERROR
+        flush_interval (float): Max no. of seconds a frame can remain in the
+            buffer. Periodic flushing is disabled if falsy. Default: 1.0
+        kwargs: Any other arguments accepted by graypy.GELFTCPHandler
+    """
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        capacity: int = 100,
+        flush_level: int = logging.ERROR,
+        flush_interval: float = 1.0,
+        **kwargs
+    ):
+        super().__init__(host=host, port=port, **kwargs)
+
+        self.capacity = capacity
+        self.flush_level = flush_level
+        self.flush_interval = flush_interval
+        self.buffer = []
+
+        self._closing = threading.Event()
+        self._flusher = None
+        if self.flush_interval:
+            self._flusher = threading.Thread(
+                target=self._flush_periodically,
+                daemon=True
+            )
+            self._flusher.start()
+
+    ###########
+    # Helpers #
+    ###########
+
+    def _flush_periodically(self) -> None:
+        """ Flushes the buffer every `flush_interval` seconds until the handler
+            is closed
+        """
+        while not self._closing.wait(self.flush_interval):
+            self.flush()
+
+    ##################
+    # Core Functions #
+    ##################
+
+    def makeSocket(self, timeout: float = 1) -> socket.socket:
+        """ Creates the TCP connection to Graylog, with Nagle's algorithm 
+            disabled so that small GELF frames are sent out immediately, and 
+            keepalives enabled so that idle connections are not dropped in
+            between bursts of logging
+
+        Args:
+            timeout (float): Connection timeout in seconds. Default: 1
+        Returns:
+            TCP socket (socket.socket)
+        """
+        tcp_socket = super().makeSocket(timeout)
+        tcp_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        tcp_socket.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        return tcp_socket
+
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """ Serialises a record into a GELF frame & buffers it, flushing the
+            buffer if any of the flush conditions are met
+
+        Args:
+            record (logging.LogRecord): Record to be logged
+        """
+        try:
+            self.buffer.append(self.makePickle(record))
+            if (
+                len(self.buffer) >= self.capacity or
+                record.levelno >= self.flush_level
+            ):
+                self.flush()
+
+        except Exception:
+            self.handleError(record)
+
+
+    def flush(self) -> None:
+        """ Sends all buffered GELF frames to Graylog in a single write
+        """
+        self.acquire()
+        try:
+            if self.buffer:
+                self.send(b"".join(self.buffer))
+                self.buffer = []
+        finally:
+            self.release()
+
+
+    def close(self) -> None:
+        """ Stops periodic flushing, and sends out any remaining frames before
+            closing the socket
+        """
+        self._closing.set()
+        try:
+            self.flush()
+        finally:
+            super().close()
+
+
+
+##########################################################
+# Organisation Handler Class - GELFTCPPrerenderedHandler #
+##########################################################
+
+class GELFTCPPrerenderedHandler(GELFTCPBatchHandler):
+    """
+    Batched GELF TCP handler for records whose messages are already fully
+    rendered GELF payloads (i.e. via `StructlogUtils.gelf_renderer`). Such
+    messages are framed & sent as-is, skipping graypy's conversion of the
+    log record into a GELF dictionary and its subsequent JSON serialisation.
+
+    Attributes:
+        host (str): Host address of the Graylog server e.g. 127.0.0.1
+        port (int): Port of the Graylog GELF TCP input e.g. 9300
+        kwargs: Any other arguments accepted by GELFTCPBatchHandler
+    """
+
+    ##################
+    # Core Functions #
+    ##################
+
+    def makePickle(self, record: logging.LogRecord) -> bytes:
+        """ Frames a pre-rendered GELF payload for transmission over TCP
+
+        Args:
+            record (logging.LogRecord): Record holding a GELF payload
+        Returns:
+            Null terminated GELF payload (bytes)
+        """
+        return record.getMessage().encode("utf-8") + b"\x00"
+
+
+
+####################################################
+# Organisation Handler Class - GELFUDPTunedHandler #
+####################################################
+
+class GELFUDPTunedHandler(OrjsonGELFMixin, graypy.GELFUDPHandler):
+    """
+    GELF UDP handler whose socket is created with an enlarged kernel send
+    buffer, so that bursts of `sendto()` calls are less likely to block or
+    be dropped locally. GELF messages exceeding `chunk_size` are chunked as
+    per the GELF specification.
+
+    Attributes:
+        host (str): Host address of the Graylog server e.g. 127.0.0.1
+        port (int): Port of the Graylog GELF UDP input e.g. 9300
+        chunk_size (int): Max size of each GELF chunk. Default: 1420 (i.e.
+            fits within a standard 1500-byte ethernet MTU)
+        send_buffer_size (int): Requested size of the socket's kernel send
+            buffer in bytes. Default: 1 MiB
+        kwargs: Any other arguments accepted by graypy.GELFUDPHandler
+    """
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        chunk_size: int = 1420,
+        send_buffer_size: int = 1 << 20,
+        **kwargs
+    ):
+        super().__init__(
+            host=host, 
+            port=port, 
+            gelf_chunker=graypy.handler.GELFWarningChunker(chunk_size),
+            **kwargs
+        )
+        self.send_buffer_size = send_buffer_size
+
+    ##################
+    # Core Functions #
+    ##################
+
+    def makeSocket(self) -> socket.socket:
+        """ Creates the UDP socket used for sending GELF messages, with an
+            enlarged kernel send buffer
+
+        Returns:
+            UDP socket (socket.socket)
+        """
+        udp_socket = super().makeSocket()
+        udp_socket.setsockopt(
+            socket.SOL_SOCKET, 
+            socket.SO_SNDBUF, 
+            self.send_buffer_size
+        )
+        return udp_socket
+
+
+
+#####################################################
+# Organisation Handler Class - OverflowQueueHandler #
+#####################################################
+
+class OverflowQueueHandler(QueueHandler):
+    """
+    Queue handler for bounded queues, which sheds low-severity records under
+    backpressure (i.e. when the queue is full because the downstream sink has
+    stalled), instead of letting memory grow or raising errors. Records of
+    `overflow_level` or higher wait up to `overflow_timeout` seconds for space
+    to free up in the queue, and are only dropped thereafter, so that a dead
+    listener never hangs the application. Drops are reported to stderr (i.e.
+    via `logging.lastResort`) upon the first drop, and upon closing.
+
+    Attributes:
+        queue (queue.Queue): Bounded queue feeding the downstream listener
+        overflow_level (int): Minimum logging level of records that must be
+            retained when the queue is full. Default: logging.WARNING
+        overflow_timeout (float): Max no. of seconds a record of 
+            `overflow_level` or higher waits for space in the queue before it
+            is dropped. Default: 1.0
+        dropped (int): No. of records dropped due to backpressure so far
+    """
+    def __init__(
+        self, 
+        queue: queue.Queue, 
+        overflow_level: int = logging.WARNING,
+        overflow_timeout: float = 1.0
+    ):
+        super().__init__(queue)
+        self.overflow_level = overflow_level
+        self.overflow_timeout = overflow_timeout
+        self.dropped = 0
+        self._dropped_lock = threading.Lock()
+
+    ###########
+    # Helpers #
+    ###########
+
+    def _drop(self) -> None:
+        """ Counts a record dropped due to backpressure, reporting the 1st drop
+            so that shedding is never entirely silent
+        """
+        with self._dropped_lock:
+            self.dropped += 1
+            is_first_drop = self.dropped == 1
+        if is_first_drop:
+            self._report_dropped()
+
+
+    def _report_dropped(self) -> None:
+        """ Reports the no. of records dropped so far to stderr, bypassing the
+            (stalled) queue
+        """
+        report = logging.makeLogRecord({
+            'name': __name__,
+            'levelno': logging.WARNING,
+            'levelname': logging.getLevelName(logging.WARNING),
+            'msg': "%s dropped %d record(s) due to backpressure",
+            'args': (type(self).__name__, self.dropped)
+        })
+        logging.lastResort.handle(report)
+
+    ##################
+    # Core Functions #
+    ##################
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """ Enqueues a record without blocking, dropping it if the queue is full
+            & the record is not severe enough to be retained. Severe records
+            are dropped only if no space frees up within `overflow_timeout`.
+
+        Args:
+            record (logging.LogRecord): Prepared record to be enqueued
+        """
+        try:
+            self.queue.put_nowait(record)
+
+        except queue.Full:
+            if record.levelno < self.overflow_level:
+                self._drop()
+                return
+
+            try:
+                self.queue.put(record, timeout=self.overflow_timeout)
+            except queue.Full:
+                self._drop()
+
+
+    def close(self) -> None:
+        """ Reports the total no. of records dropped, if any, before closing
+        """
+        if self.dropped:
+            self._report_dropped()
+        super().close()
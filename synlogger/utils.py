@@ -5,21 +5,266 @@
 ####################
 
 # Generic/Built-in
-import datetime
-import inspect
-from typing import List, Tuple
+import json
+import logging
+import os
+import socket
+import threading
+import time
+from types import MappingProxyType
+from typing import Any, List, Tuple
 
 # Lib
-import psutil
-from structlog._frames import _find_first_app_frame_and_name
+import orjson
+from structlog.processors import StackInfoRenderer, format_exc_info
+from structlog.stdlib import PositionalArgumentsFormatter
 
 # Custom
-from synlogger.config import CENSOR
+from synlogger.config import CENSOR, IO_COUNTERS_RESOLUTION, TIMESTAMP_FORMAT
 
 ##################
 # Configurations #
 ##################
 
+# Formatted timestamp of the last second logged, as (epoch second, timestamp)
+_timestamp_cache = (0, "")
+
+# Stdlib logging level numbers of each level name (incl. aliases)
+LEVEL_NUMBERS = {
+    'critical': logging.CRITICAL,
+    'exception': logging.ERROR,
+    'error': logging.ERROR,
+    'warn': logging.WARNING,
+    'warning': logging.WARNING,
+    'info': logging.INFO,
+    'debug': logging.DEBUG,
+    'notset': logging.NOTSET
+}
+
+# Host identity & syslog severities declared within GELF payloads
+GELF_HOST = socket.gethostname()
+GELF_SYSLOG_LEVELS = {
+    'critical': 2, 
+    'exception': 3, 
+    'error': 3, 
+    'warning': 4, 
+    'info': 6, 
+    'debug': 7,
+    'notset': 7
+}
+
+# Default graypy debugging fields, blanked out in all events sent to Graylog
+GRAYPY_DEBUG_BLANKS = MappingProxyType({
+    'pid': "",
+    'process_name': "",
+    'thread_name': "",
+    'file': "",
+    'function': ""
+})
+
+# Total physical memory is invariant at runtime, so it is only read once
+_memory_total = None
+
+# Latest CPU utilisation sampled in the background, shared by all trackers. The
+# 1st reading is published after a brief warm-up, instead of a full interval.
+_cpu_snapshot = {'cpu_percent': 0.0}
+CPU_WARMUP_INTERVAL = 0.1
+_cpu_sampler = None
+_cpu_sampler_resolution = None
+_cpu_sampler_stop = threading.Event() # signals the running sampler to stop
+_cpu_sampler_lock = threading.RLock()
+
+# Latest DiskIO & NetworkIO snapshots, as (monotonic time, disk, network)
+_io_counters = (float('-inf'), None, None)
+
+# Stateless structlog processors reused by fused processors
+_POSITIONAL_ARGS_FORMATTER = PositionalArgumentsFormatter()
+_STACK_INFO_RENDERER = StackInfoRenderer()
+
+# Per-thread kwargs template reused by the graypy adapter across events
+_graypy_kwargs = threading.local()
+
+###########
+# Helpers #
+###########
+
+def get_cached_timestamp() -> str:
+    """ Retrieves the current UTC time formatted with TIMESTAMP_FORMAT. Since
+        the format has a resolution of 1 second, formatting is only performed
+        once per second, regardless of the no. of events logged.
+
+    Returns:
+        Formatted timestamp (str)
+    """
+    global _timestamp_cache
+    curr_second = int(time.time())
+    if curr_second != _timestamp_cache[0]:
+        formatted = time.strftime(TIMESTAMP_FORMAT, time.gmtime(curr_second))
+        _timestamp_cache = (curr_second, formatted)
+    return _timestamp_cache[1]
+
+
+def get_memory_total() -> int:
+    """ Retrieves the total physical memory of the system, which is only read
+        on first use since it is invariant at runtime
+
+    Returns:
+        Total memory in bytes (int)
+    """
+    global _memory_total
+    if _memory_total is None:
+        import psutil
+        _memory_total = psutil.virtual_memory().total
+    return _memory_total
+
+
+def _sample_cpu_periodically(
+    resolution: float, 
+    stop: threading.Event
+) -> None:
+    """ Refreshes the shared CPU utilisation snapshot every `resolution` 
+        seconds, until the specified stop event is set. Being the sole caller 
+        of `psutil.cpu_percent`, each reading spans exactly 1 sampling 
+        interval, regardless of how many trackers read the snapshot in 
+        between. The 1st reading is taken after a brief warm-up, so that early
+        probes do not report a placeholder of 0.0.
+
+    Args:
+        resolution (float): Sampling interval in seconds
+        stop (threading.Event): Event signalling the sampler to stop
+    """
+    import psutil # deferred, so that only metric loggers pay its import cost
+
+    psutil.cpu_percent(interval=None) # establishes the 1st reference point
+    interval = min(resolution, CPU_WARMUP_INTERVAL)
+    while not stop.wait(interval):
+        _cpu_snapshot['cpu_percent'] = psutil.cpu_percent(interval=None)
+        interval = resolution
+
+
+def _reset_cpu_sampler() -> None:
+    """ Discards the sampler inherited from a parent process, since threads do
+        not survive forking
+    """
+    global _cpu_sampler, _cpu_sampler_stop, _cpu_sampler_lock
+    _cpu_sampler_stop.set()
+    _cpu_sampler = None
+    _cpu_sampler_stop = threading.Event()
+    _cpu_sampler_lock = threading.RLock()
+
+os.register_at_fork(after_in_child=_reset_cpu_sampler)
+
+
+def start_cpu_sampler(resolution: float = 1.0) -> threading.Thread:
+    """ Starts the background CPU sampler of the current process, if it is not
+        already running. Only 1 sampler is ever running per process, sampling
+        at the finest resolution requested so far (i.e. a running sampler is
+        restarted if a finer resolution is requested), so that no tracker 
+        reports readings staler than its own polling interval.
+
+    Args:
+        resolution (float): Sampling interval in seconds. Default: 1.0
+    Returns:
+        Sampler thread (threading.Thread)
+    """
+    global _cpu_sampler, _cpu_sampler_resolution
+    with _cpu_sampler_lock:
+        if _cpu_sampler is not None and resolution < _cpu_sampler_resolution:
+            stop_cpu_sampler()
+
+        if _cpu_sampler is None:
+            _cpu_sampler = threading.Thread(
+                target=_sample_cpu_periodically,
+                args=(resolution, _cpu_sampler_stop),
+                daemon=True
+            )
+            _cpu_sampler_resolution = resolution
+            _cpu_sampler.start()
+    return _cpu_sampler
+
+
+def stop_cpu_sampler() -> None:
+    """ Stops the background CPU sampler of the current process, if it is 
+        running. The last reading remains published, and a new sampler can be
+        started thereafter.
+    """
+    global _cpu_sampler, _cpu_sampler_stop
+    with _cpu_sampler_lock:
+        if _cpu_sampler is not None:
+            _cpu_sampler_stop.set()
+            _cpu_sampler = None
+            _cpu_sampler_stop = threading.Event() # for the next sampler
+
+
+def get_cpu_percent() -> float:
+    """ Retrieves the latest CPU utilisation sampled in the background, 
+        starting the sampler with its default resolution if necessary
+
+    Returns:
+        % of CPU used by system (float)
+    """
+    if _cpu_sampler is None:
+        start_cpu_sampler()
+    return _cpu_snapshot['cpu_percent']
+
+
+def get_io_counters() -> tuple:
+    """ Retrieves the latest DiskIO & NetworkIO snapshots of the system, which
+        are only refreshed once every IO_COUNTERS_RESOLUTION seconds, 
+        regardless of how often they are polled
+
+    Returns:
+        DiskIO counters (psutil._common.sdiskio)
+        NetworkIO counters (psutil._common.snetio)
+    """
+    global _io_counters
+    curr_time = time.monotonic()
+    if curr_time - _io_counters[0] >= IO_COUNTERS_RESOLUTION:
+        import psutil
+        _io_counters = (
+            curr_time, 
+            psutil.disk_io_counters(), 
+            psutil.net_io_counters()
+        )
+    return _io_counters[1], _io_counters[2]
+
+
+def orjson_default(obj: Any) -> str:
+    """ Fallback serialiser for objects that orjson does not natively support.
+        Byte strings are decoded, while all other objects are represented by
+        their repr.
+
+    Args:
+        obj (Any): Object to be serialised
+    Returns:
+        Serialisable representation (str)
+    """
+    if isinstance(obj, bytes):
+        return obj.decode("utf-8", "replace")
+    return repr(obj)
+
+
+def orjson_dumps(obj: dict) -> str:
+    """ Serialises logging metadata into a compact JSON string via orjson. 
+        Non-string keys are stringified, while payloads which orjson rejects
+        (e.g. integers wider than 64 bits) fall back to the stdlib `json` 
+        module, so that logging calls never fail on serialisation.
+
+    Args:
+        obj (dict): Logging metadata to be serialised
+    Returns:
+        Serialised metadata (str)
+    """
+    try:
+        return orjson.dumps(
+            obj, 
+            default=orjson_default, 
+            option=orjson.OPT_NON_STR_KEYS
+        ).decode()
+
+    except TypeError:
+        return json.dumps(obj, default=str, separators=(",", ":"))
+
 
 ################################################
 # Organisational Helper Class - StructlogUtils #
@@ -35,10 +280,15 @@ class StructlogUtils:
             the value "*CENSORED*". This is for protecting user-specific secrets.
         file_path (str): File location where logging is called
     """
+    # Instances are shared by all loggers of the same configuration, and hold
+    # a fixed set of attributes
+    __slots__ = ('censor_keys', '_censor_set', 'file_path')
+
     def __init__(self, censor_keys: List[str] = [], file_path: str = ""):
         # General attributes
         # e.g. misc attibutes unique to problem
         self.censor_keys = censor_keys
+        self._censor_set = frozenset(censor_keys) # O(1) membership checks
         
         # Network attributes
         # e.g. server IP and/or port number
@@ -61,19 +311,114 @@ class StructlogUtils:
     # Helpers #
     ###########
 
+    def add_log_level_number(self, _, __, event_dict: dict) -> dict:
+        """ Updates logging metadata with the numeric value of the logged level,
+            via a static lookup (i.e. a drop-in for Structlog's 
+            `add_log_level_number`). Levels must already have been added.
+
+        Args:
+            event_dict (dict): Logging metadata accumulated
+        Returns:
+            Updated event metadata (dict)
+        """
+        event_dict['level_number'] = LEVEL_NUMBERS.get(
+            event_dict.get('level'), 
+            logging.NOTSET
+        )
+        return event_dict
+
+
+    def add_default_metadata(
+        self, 
+        logger, 
+        method_name: str, 
+        event_dict: dict
+    ) -> dict:
+        """ Fused equivalent of the default metadata processors. A single call
+            stamps the logger name, level, level number, timestamp & file path.
+            Positional arguments, exceptions and stack information are only 
+            processed when they are present in the event.
+
+        Args:
+            logger (logging.Logger): Logger wrapped by Structlog
+            method_name (str): Name of logging method invoked e.g. "info"
+            event_dict (dict): Logging metadata accumulated
+        Returns:
+            Updated event metadata (dict)
+        """
+        if method_name == "warn":
+            method_name = "warning" # The stdlib has an alias
+
+        event_dict['logger'] = logger.name
+        event_dict['level'] = method_name
+        event_dict['level_number'] = LEVEL_NUMBERS[method_name]
+
+        if "positional_args" in event_dict:
+            event_dict = _POSITIONAL_ARGS_FORMATTER(
+                logger, method_name, event_dict
+            )
+        event_dict = self.format_exc_and_stack_info(
+            logger, method_name, event_dict
+        )
+        event_dict['timestamp'] = get_cached_timestamp()
+        event_dict['file_path'] = self.file_path
+        return event_dict
+
+
+    def format_exc_and_stack_info(
+        self, 
+        logger, 
+        method_name: str, 
+        event_dict: dict
+    ) -> dict:
+        """ Renders exception & stack information into the logging metadata, 
+            only if they were requested. Combines Structlog's 
+            `format_exc_info` & `StackInfoRenderer` into a single processor, 
+            which exits immediately for the common case of plain events.
+
+        Args:
+            logger (logging.Logger): Logger wrapped by Structlog
+            method_name (str): Name of logging method invoked e.g. "info"
+            event_dict (dict): Logging metadata accumulated
+        Returns:
+            Updated event metadata (dict)
+        """
+        if "exc_info" in event_dict:
+            event_dict = format_exc_info(logger, method_name, event_dict)
+        if "stack_info" in event_dict:
+            event_dict = _STACK_INFO_RENDERER(logger, method_name, event_dict)
+        return event_dict
+
+
     def censor_logging(self, _, __, event_dict: dict) -> dict:
         """ Censor log information based on the the keys in the list 
-            "censor_keys"
+            "censor_keys". Nested dictionaries are censored as well, and are
+            walked iteratively. Each nested dictionary is shallow-copied before
+            it is censored, so that arguments passed in by the caller are never
+            modified.
 
         Args:
             event_dict (dict): Logging metadata accumulated
         Returns:
             Censored event metadata (dict)
         """
-        for key in self.censor_keys:
-            k = event_dict.get(key)
-            if k:
-                event_dict[key] = CENSOR
+        if not self._censor_set:
+            return event_dict
+
+        pending_dicts = [event_dict]
+        while pending_dicts:
+            curr_dict = pending_dicts.pop()
+
+            # Keys to censor are matched via a C-level set intersection
+            for key in self._censor_set.intersection(curr_dict):
+                if curr_dict[key]:
+                    curr_dict[key] = CENSOR
+
+            # Nested dictionaries are still owned by the caller
+            for key, value in curr_dict.items():
+                if isinstance(value, dict):
+                    curr_dict[key] = value = dict(value)
+                    pending_dicts.append(value)
         return event_dict
 
 
@@ -90,29 +435,58 @@ class StructlogUtils:
         return event_dict
 
 
+    def add_file_path_and_censor(self, _, __, event_dict: dict) -> dict:
+        """ Fused equivalent of `get_file_path` followed by `censor_logging`,
+            so that chains with keys to censor make a single call, instead of
+            two, right before rendering
+
+        Args:
+            event_dict (dict): Logging metadata accumulated
+        Returns:
+            Censored event metadata (dict)
+        """
+        event_dict['file_path'] = self.file_path
+        return self.censor_logging(_, __, event_dict)
+
+
     def add_timestamp(self, _, __, event_dict: dict) -> dict:
         """ Updates logging metadata with the timestamp during which logging
-            events were accumulated from
+            events were accumulated from, as seconds since the epoch (i.e. the
+            numeric form accepted by GELF as-is)
+
+        Args:
+            event_dict (dict): Logging metadata accumulated
+        Returns:
+            Updated event metadata (dict)
+        """
+        event_dict['timestamp'] = time.time_ns() / 1e9
+        return event_dict
+
+
+    def add_cached_timestamp(self, _, __, event_dict: dict) -> dict:
+        """ Updates logging metadata with the timestamp during which logging
+            events were accumulated from, formatted with TIMESTAMP_FORMAT. 
+            Formatting is performed at most once per second.
 
         Args:
             event_dict (dict): Logging metadata accumulated
         Returns:
             Updated event metadata (dict)
         """
-        event_dict['timestamp'] = datetime.datetime.utcnow()
+        event_dict['timestamp'] = get_cached_timestamp()
         return event_dict
 
 
     def track_cpu_stats(self, _, __, event_dict: dict) -> dict:
         """ Logs the following CPU statistics of the system:
-            1) % of CPU used by system
+            1) % of CPU used by system, as last sampled in the background
 
         Args:
             event_dict (dict): Logging metadata accumulated
         Returns:
             Updated event metadata (dict)
         """
-        event_dict['cpu_percent'] = psutil.cpu_percent(interval=None)
+        event_dict['cpu_percent'] = get_cpu_percent()
         return event_dict
 
 
@@ -129,10 +503,13 @@ class StructlogUtils:
         Returns:
             Updated event metadata (dict)
         """
-        event_dict['memory_total'] = psutil.virtual_memory().total
-        event_dict['memory_available'] = psutil.virtual_memory().available
-        event_dict['memory_used'] = psutil.virtual_memory().used
-        event_dict['memory_free'] = psutil.virtual_memory().free
+        import psutil
+
+        memory_stats = psutil.virtual_memory() # 1 snapshot for all fields
+        event_dict['memory_total'] = get_memory_total()
+        event_dict['memory_available'] = memory_stats.available
+        event_dict['memory_used'] = memory_stats.used
+        event_dict['memory_free'] = memory_stats.free
         return event_dict
 
 
@@ -148,10 +525,11 @@ class StructlogUtils:
         Returns:
             Updated event metadata (dict)
         """
-        event_dict['disk_read_counter'] = psutil.disk_io_counters().read_count
-        event_dict['disk_write_counter'] = psutil.disk_io_counters().write_count
-        event_dict['disk_read_bytes'] = psutil.disk_io_counters().read_bytes
-        event_dict['disk_write_bytes'] = psutil.disk_io_counters().write_bytes
+        disk_stats, _ = get_io_counters() # 1 snapshot for all fields
+        event_dict['disk_read_counter'] = disk_stats.read_count
+        event_dict['disk_write_counter'] = disk_stats.write_count
+        event_dict['disk_read_bytes'] = disk_stats.read_bytes
+        event_dict['disk_write_bytes'] = disk_stats.write_bytes
         return event_dict
 
 
@@ -167,13 +545,147 @@ class StructlogUtils:
         Returns:
             Updated event metadata (dict)
         """
-        event_dict['net_bytes_sent'] = psutil.net_io_counters().bytes_sent
-        event_dict['net_bytes_recv'] = psutil.net_io_counters().bytes_recv
-        event_dict['net_packets_sent'] = psutil.net_io_counters().packets_sent
-        event_dict['net_packets_recv'] = psutil.net_io_counters().packets_recv
+        _, network_stats = get_io_counters() # 1 snapshot for all fields
+        event_dict['net_bytes_sent'] = network_stats.bytes_sent
+        event_dict['net_bytes_recv'] = network_stats.bytes_recv
+        event_dict['net_packets_sent'] = network_stats.packets_sent
+        event_dict['net_packets_recv'] = network_stats.packets_recv
         return event_dict
 
 
+    def track_system_stats(self, _, __, event_dict: dict) -> dict:
+        """ Logs all CPU, memory, DiskIO & NetworkIO statistics of the system
+            (i.e. as per `track_cpu_stats`, `track_memory_stats`, 
+            `track_disk_stats` & `track_network_stats`) in a single processor,
+            with at most one psutil snapshot taken per statistic group. DiskIO
+            & NetworkIO snapshots are refreshed at a lower frequency (i.e. 
+            once every IO_COUNTERS_RESOLUTION seconds).
+
+        Args:
+            event_dict (dict): Logging metadata accumulated
+        Returns:
+            Updated event metadata (dict)
+        """
+        import psutil
+
+        memory_stats = psutil.virtual_memory()
+        disk_stats, network_stats = get_io_counters()
+        event_dict.update({
+            'cpu_percent': get_cpu_percent(),
+            'memory_total': get_memory_total(),
+            'memory_available': memory_stats.available,
+            'memory_used': memory_stats.used,
+            'memory_free': memory_stats.free,
+            'disk_read_counter': disk_stats.read_count,
+            'disk_write_counter': disk_stats.write_count,
+            'disk_read_bytes': disk_stats.read_bytes,
+            'disk_write_bytes': disk_stats.write_bytes,
+            'net_bytes_sent': network_stats.bytes_sent,
+            'net_bytes_recv': network_stats.bytes_recv,
+            'net_packets_sent': network_stats.packets_sent,
+            'net_packets_recv': network_stats.packets_recv
+        })
+        return event_dict
+
+
+    def orjson_renderer(self, _, __, event_dict: dict) -> str:
+        """ Renders logging metadata as a compact JSON string. Serialisation is
+            handled by orjson's C extension instead of the stdlib `json` module,
+            and pretty-printing is omitted to keep each record small.
+
+        Args:
+            event_dict (dict): Logging metadata accumulated
+        Returns:
+            Serialised event metadata (str)
+        """
+        return orjson_dumps(event_dict)
+
+
+    def basic_fast_renderer(
+        self, 
+        logger, 
+        method_name: str, 
+        event_dict: dict
+    ) -> str:
+        """ Fused equivalent of the default 'basic' processor chain (excluding
+            level filtering), for loggers without censors or custom filters. A
+            single call stamps the logger name, level, level number, timestamp
+            & file path before rendering the event as JSON. Positional 
+            arguments, exceptions and stack information are only processed
+            when they are present in the event.
+
+        Args:
+            logger (logging.Logger): Logger wrapped by Structlog
+            method_name (str): Name of logging method invoked e.g. "info"
+            event_dict (dict): Logging metadata accumulated
+        Returns:
+            Serialised event metadata (str)
+        """
+        event_dict = self.add_default_metadata(logger, method_name, event_dict)
+        return orjson_dumps(event_dict)
+
+
+    def gelf_fast_renderer(
+        self, 
+        logger, 
+        method_name: str, 
+        event_dict: dict
+    ) -> str:
+        """ Fused equivalent of the default 'gelf' processor chain (excluding
+            level filtering), for loggers without censors or custom filters. 
+            Default metadata is stamped in a single call before the event is
+            rendered into a GELF payload.
+
+        Args:
+            logger (logging.Logger): Logger wrapped by Structlog
+            method_name (str): Name of logging method invoked e.g. "info"
+            event_dict (dict): Logging metadata accumulated
+        Returns:
+            Serialised GELF payload (str)
+        """
+        event_dict = self.add_default_metadata(logger, method_name, event_dict)
+        return self.gelf_renderer(logger, method_name, event_dict)
+
+
+    def gelf_renderer(
+        self, 
+        logger, 
+        method_name: str, 
+        event_dict: dict
+    ) -> str:
+        """ Renders logging metadata directly into a GELF payload, so that it
+            can be sent to Graylog as-is (i.e. without graypy re-casting the 
+            event into a log record & re-serialising it). All logged metadata
+            are declared as additional GELF fields.
+
+        Args:
+            logger (logging.Logger): Logger wrapped by Structlog
+            method_name (str): Name of logging method invoked e.g. "info"
+            event_dict (dict): Logging metadata accumulated
+        Returns:
+            Serialised GELF payload (str)
+        """
+        level_name = event_dict.get('level', method_name)
+        gelf_dict = {
+            "version": "1.1",
+            "host": GELF_HOST,
+            # GELF requires a non-empty string as its short message
+            "short_message": str(event_dict.get('event') or '-'),
+            "timestamp": time.time(),
+            "level": GELF_SYSLOG_LEVELS.get(level_name, 6),
+            "level_name": level_name.upper(),
+            "_logger": logger.name,
+            **{
+                f"_{key}": value 
+                for key, value in event_dict.items()
+                # '_id' is reserved by Graylog, while the event is already
+                # declared as the short message
+                if key not in ('id', 'event')
+            }
+        }
+        return orjson_dumps(gelf_dict)
+
+
     def graypy_structlog_processor(
         self, _, __,
         event_dict: dict
@@ -186,17 +698,16 @@ class StructlogUtils:
             args (tuple(str))
             kwargs (dict)
         """
-        args = (event_dict.get('event', ''),)
-        kwargs = {'extra': event_dict}
-
-        # The following are default graypy metrics which is logged to the 
-        # graylog server comment these out if the following metrics are 
-        # necessary. Alternatively we can set debugging_fields=False in GELF 
-        # handler which is similar to the below kwargs setting
-        kwargs['extra']['pid'] = ""
-        kwargs['extra']['process_name'] = ""
-        kwargs['extra']['thread_name'] = ""
-        kwargs['extra']['file'] = ""
-        kwargs['extra']['function'] = ""
-
-        return args, kwargs
+        # The default graypy metrics which are logged to the graylog server are
+        # blanked out (see GRAYPY_DEBUG_BLANKS). Remove them from the template
+        # if the metrics are necessary. Alternatively we can set 
+        # debugging_fields=False in GELF handler which is similar.
+        event_dict.update(GRAYPY_DEBUG_BLANKS)
+
+        # Structlog unpacks the kwargs into the stdlib logging call (i.e.
+        # `**kwargs`), so the template is never retained & can be reused
+        kwargs = getattr(_graypy_kwargs, 'template', None)
+        if kwargs is None:
+            kwargs = _graypy_kwargs.template = {'extra': None}
+        kwargs['extra'] = event_dict
+        return (event_dict.get('event', ''),), kwargs
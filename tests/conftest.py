@@ -5,10 +5,11 @@
 ####################
 
 # Generic/Built-in
-import contextlib
+import json
 import logging
+import queue
 import random
-from string import Template
+import socket
 from typing import Callable
 
 # Libs
@@ -40,23 +41,19 @@ SYSMETRIC_SUPPORTED_METADATA = DEFAULT_SUPPORTED_METADATA + [
 DEFAULT_TRACKERS = [
     structlog.stdlib.add_logger_name,
     structlog.stdlib.add_log_level,
-    structlog.stdlib.add_log_level_number,
+    synlogger.utils.StructlogUtils.add_log_level_number,
     structlog.stdlib.filter_by_level,
     structlog.stdlib.PositionalArgumentsFormatter(),
-    structlog.processors.format_exc_info,
-    structlog.processors.TimeStamper(fmt="%Y-%m-%d %H:%M.%S"),
-    structlog.processors.StackInfoRenderer(), 
+    synlogger.utils.StructlogUtils.format_exc_and_stack_info,
+    synlogger.utils.StructlogUtils.add_cached_timestamp,
     structlog.processors.UnicodeDecoder(),
 ]
 SYSMETRIC_TRACKERS = DEFAULT_TRACKERS + [
-    synlogger.utils.StructlogUtils.track_cpu_stats,
-    synlogger.utils.StructlogUtils.track_memory_stats,
-    synlogger.utils.StructlogUtils.track_disk_stats,
-    synlogger.utils.StructlogUtils.track_network_stats
+    synlogger.utils.StructlogUtils.track_system_stats
 ]
 
 TRIALS = 20
-EVENT_TEMPLATE = Template("This is Test no. $trial_idx!")
+EVENT_TEMPLATE = "This is Test no. {trial_idx}!".format
 DURATION = 1
 POLL_INTERVAL = 0.1
 
@@ -73,42 +70,8 @@ def extract_name(callable: Callable) -> str:
     Return:
         Name of callable (str)
     """
-    try:
-        return callable.__name__
-    except:
-        return type(callable).__class__.__name__
-
-
-@contextlib.contextmanager
-def reconfigure_global_structlog_params(syn_logger):
-    """ Takes in a customised Synergos logger and  applies its params to the
-        global context. This is required due to how Structlog.wrap_logger()
-        works. There currently no way to capture logs from custom wrapped
-        logger
-    
-    Args:
-        syn_logger (synlogger.base.RootLogger): 
-    """    
-    # Save settings for subsequent restoration
-    saved_config = structlog.get_config()
-
-    # Extract custom processors in preparation for global override 
-    custom_processors = syn_logger.synlog._processors
-
-    try:
-        structlog.reset_defaults()
-        structlog.configure(
-            processors=custom_processors,
-            wrapper_class=structlog.stdlib.BoundLogger,
-            context_class=dict
-        )
-        logging.basicConfig(level=syn_logger.logging_level)
-        logging_renderer = custom_processors[-1]
-        yield logging_renderer.entries
-
-    finally:
-        # back to normal behavior
-        structlog.configure(**saved_config)
+    # Callable instances (e.g. processor objects) are named after their class
+    return getattr(callable, '__name__', None) or type(callable).__name__
 
 
 def valid_test_filter(_, __, event_dict):
@@ -153,50 +116,113 @@ def invalid_test_filter_wrong_outputs(_, __, event_dict):
     """
     return "some test string that violates the supposed proposed output"
 
+
+def make_record(
+    msg: str, 
+    level: int = logging.INFO, 
+    name: str = "test_handler"
+) -> logging.LogRecord:
+    """ Creates a bare log record for direct submission to a handler
+
+    Args:
+        msg (str): Message to be logged
+        level (int): Logging level of the record. Default: logging.INFO
+        name (str): Name of the logger emitting the record. 
+            Default: "test_handler"
+    Returns:
+        Log record (logging.LogRecord)
+    """
+    return logging.LogRecord(
+        name=name,
+        level=level,
+        pathname=__file__,
+        lineno=0,
+        msg=msg,
+        args=None,
+        exc_info=None
+    )
+
+
+def receive_frames(server_socket, count: int) -> list:
+    """ Accepts a connection on the specified server socket, and reads from it
+        until the specified no. of null-terminated GELF frames are received
+
+    Args:
+        server_socket (socket.socket): Listening socket
+        count (int): No. of GELF frames expected
+    Returns:
+        Decoded GELF frames (list(dict))
+    """
+    connection, _ = server_socket.accept()
+    with connection:
+        data = b""
+        while data.count(b"\x00") < count:
+            chunk = connection.recv(65536)
+            if not chunk:
+                break
+            data += chunk
+    return [json.loads(frame) for frame in data.split(b"\x00") if frame]
+
 ##########################
 # Miscellaneous Fixtures #
 ##########################
 
 @pytest.fixture
+def captured_entries(monkeypatch):
+    # 'test' loggers render into `structlog.testing.LogCapture`, which is 
+    # swapped for a single capture for the duration of the test. Entries logged
+    # by any 'test' logger initialised within the test are thus exposed, after
+    # passing through the logger's full processor chain.
+    capture = structlog.testing.LogCapture()
+    monkeypatch.setattr(structlog.testing, "LogCapture", lambda: capture)
+    return capture.entries
+
+
+@pytest.fixture(scope="session")
 def connect_kwargs():
     return {'server': HOST, 'port': PORT}
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_kwargs():
-    random_base = random.randint(0, 10000000)
+    base = 12345 # deterministic, so that the fixture is built only once
     return {
-        'kwargs_test_str': f"test_string_{random_base}",
-        'kwargs_test_int': 42 * random_base,
-        'kwargs_test_float': 69.69 * random_base
+        'kwargs_test_str': f"test_string_{base}",
+        'kwargs_test_int': 42 * base,
+        'kwargs_test_float': 69.69 * base
     }
 
 
 @pytest.fixture
 def event_kwargs(connect_kwargs, test_kwargs):
+    # Processors mutate event dictionaries, so each test gets a fresh copy
     return {**connect_kwargs, **test_kwargs}
 
 ############################################
 # StructlogUtils Helper Component Fixtures #
 ############################################
 
-@pytest.fixture
+# Structlog utilities hold no per-event state, so unmutated instances are only
+# built once per session. Loggers remain function-scoped, since tests assert
+# on their state transitions (e.g. `.initialise()`).
+
+@pytest.fixture(scope="session")
 def structlog_utils_default_params():
     return synlogger.utils.StructlogUtils()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def structlog_utils():
     return synlogger.utils.StructlogUtils(
         file_path="/path/to/testfile"
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def structlog_utils_with_censors(connect_kwargs, test_kwargs):
     all_keys = list(connect_kwargs.keys()) + list(test_kwargs.keys())
     n = 3
-    keys_to_censor = random.sample(all_keys, n)
+    keys_to_censor = random.sample(all_keys, n) # sampled once per session
     return synlogger.utils.StructlogUtils(
         censor_keys=keys_to_censor,
         file_path="/path/to/testfile"
@@ -228,6 +254,28 @@ def root_logger_remote(connect_kwargs):
     )
 
 
+@pytest.fixture
+def root_logger_remote_udp(connect_kwargs):
+    return synlogger.base.RootLogger(
+        **connect_kwargs,
+        logger_name="test_remote_udp_logger",
+        logging_variant="graylog",
+        transport="udp"
+    )
+
+
+@pytest.fixture
+def root_logger_remote_gelf(gelf_tcp_server):
+    _, port = gelf_tcp_server.getsockname()
+    return synlogger.base.RootLogger(
+        server=HOST,
+        port=port,
+        logger_name="test_remote_gelf_logger",
+        logging_variant="gelf",
+        buffer_capacity=1
+    )
+
+
 @pytest.fixture
 def root_logger_custom_filters_valid():
     return synlogger.base.RootLogger(
@@ -278,12 +326,87 @@ def worker_logger():
         logger_name="Test_worker_logger"
     )
 
+##########################################
+# GELFTCPBatchHandler Component Fixtures #
+##########################################
+
+@pytest.fixture
+def gelf_tcp_server():
+    server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    server_socket.bind((HOST, 0)) # bind to any available port
+    server_socket.listen(1)
+    server_socket.settimeout(5)
+    yield server_socket
+    server_socket.close()
+
+
+@pytest.fixture
+def gelf_tcp_batch_handler(gelf_tcp_server):
+    _, port = gelf_tcp_server.getsockname()
+    # Handlers pull in graypy, so they are only imported by tests using them
+    from synlogger.handlers import GELFTCPBatchHandler
+
+    handler = GELFTCPBatchHandler(
+        host=HOST,
+        port=port,
+        capacity=TRIALS,
+        flush_interval=None
+    )
+    yield handler
+    handler.close()
+
+##########################################
+# GELFUDPTunedHandler Component Fixtures #
+##########################################
+
+@pytest.fixture
+def gelf_udp_server():
+    server_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    server_socket.bind((HOST, 0)) # bind to any available port
+    server_socket.settimeout(5)
+    yield server_socket
+    server_socket.close()
+
+
+@pytest.fixture
+def gelf_udp_tuned_handler(gelf_udp_server):
+    _, port = gelf_udp_server.getsockname()
+    from synlogger.handlers import GELFUDPTunedHandler
+
+    handler = GELFUDPTunedHandler(host=HOST, port=port)
+    yield handler
+    handler.close()
+
+###########################################
+# OverflowQueueHandler Component Fixtures #
+###########################################
+
+@pytest.fixture
+def overflow_queue_handler():
+    from synlogger.handlers import OverflowQueueHandler
+
+    return OverflowQueueHandler(
+        queue.Queue(maxsize=TRIALS),
+        overflow_level=logging.WARNING
+    )
+
 ######################################
 # SysmetricLogger Component Fixtures #
 ######################################
 
+@pytest.fixture(scope="session")
+def prime_system_statistics():
+    # System statistics are primed once for all sysmetric tests (i.e. via the
+    # library's own shared samplers & caches), so that none of them pays for
+    # cold psutil reads. The CPU sampler is started at the trackers' polling
+    # interval, as `SysmetricLogger.track()` would.
+    synlogger.utils.start_cpu_sampler(POLL_INTERVAL)
+    synlogger.utils.get_memory_total()
+    synlogger.utils.get_io_counters()
+
+
 @pytest.fixture
-def sysmetric_logger_default_params():
+def sysmetric_logger_default_params(prime_system_statistics):
     return synlogger.general.SysmetricLogger(
         logger_name="Test_source_logger_default",
         logging_variant="basic"
@@ -291,7 +414,7 @@ def sysmetric_logger_default_params():
 
 
 @pytest.fixture
-def sysmetric_logger():
+def sysmetric_logger(prime_system_statistics):
     return synlogger.general.SysmetricLogger(
         server=HOST,
         logger_name="Test_source_logger",
@@ -6,6 +6,11 @@
 
 # Generic/Built-in
 import logging
+import os
+import subprocess
+import sys
+from dataclasses import dataclass
+from logging.handlers import QueueHandler
 from typing import Callable
 
 # Libs
@@ -19,8 +24,12 @@ from conftest import (
     DEFAULT_SUPPORTED_METADATA,
     DEFAULT_TRACKERS,
     extract_name,
-    reconfigure_global_structlog_params
+    receive_frames,
+    valid_test_filter
 )
+from synlogger.base import RootLogger, _build_processors
+from synlogger.config import CENSOR
+from synlogger.handlers import GELFTCPBatchHandler, GELFUDPTunedHandler
 from synlogger.utils import StructlogUtils
 
 ##################
@@ -28,6 +37,21 @@ from synlogger.utils import StructlogUtils
 ##################
 
 
+###########
+# Helpers #
+###########
+
+@dataclass
+class TaggingFilter:
+    """ Callable filter holding run-specific state, which is unhashable since
+        dataclasses with `eq=True` (i.e. the default) drop `__hash__`
+    """
+    tag: str
+
+    def __call__(self, _, __, event_dict: dict) -> dict:
+        event_dict['tag'] = self.tag
+        return event_dict
+
 ######################
 # Tests - RootLogger #
 ######################
@@ -77,12 +101,19 @@ def test_RootLogger_is_initialised(root_logger_default_params):
     assert root_logger_default_params.is_initialised() == True          
 
 
-def test_RootLogger_configure_processors(root_logger_default_params):
+def test_RootLogger_configure_processors(
+    root_logger_default_params,
+    root_logger_custom_filters_valid
+):
     """
     Tests if default processors loaded are valid
 
     # C1: All processors returned are functions
     # C2: logging_renderer must be the last processor of the list
+    # C3: Default processors must be included for non-trivial configurations
+    # C4: level filtering must be the first processor of the list
+    # C5: Trivial 'basic' configurations are fused into a single renderer
+    # C6: Censoring is only applied when there are keys to censor
     """
     # C1
     processors = root_logger_default_params._configure_processors()
@@ -93,15 +124,80 @@ def test_RootLogger_configure_processors(root_logger_default_params):
         extract_name(last_processor) == extract_name(_funct)
         for _funct in [
             StructlogUtils.graypy_structlog_processor,
-            structlog.processors.JSONRenderer(indent=1)
+            StructlogUtils.orjson_renderer,
+            StructlogUtils.basic_fast_renderer
         ]
     )
     # C3
-    processors_names = [extract_name(processor) for processor in processors]
+    full_processors = root_logger_custom_filters_valid._configure_processors()
+    processors_names = {extract_name(processor) for processor in full_processors}
+    assert {
+        extract_name(def_tracker) for def_tracker in DEFAULT_TRACKERS
+    }.issubset(processors_names)
+    # C4
+    assert processors[0] is structlog.stdlib.filter_by_level
+    assert full_processors[0] is structlog.stdlib.filter_by_level
+    # C5
+    assert len(processors) == 2
+    assert extract_name(last_processor) == "basic_fast_renderer"
+    # C6
+    assert "add_file_path_and_censor" not in processors_names
+    censored_processors = RootLogger(
+        logging_variant="test",
+        censor_keys=["secret"]
+    )._configure_processors()
+    assert (
+        extract_name(censored_processors[-2]) == "add_file_path_and_censor"
+    )
+
+
+def test_RootLogger_configure_processors_caching(
+    root_logger_default_params,
+    root_logger_local
+):
+    """
+    Tests if processor chains are reused across identically configured loggers
+
+    # C1: Loggers of the same configuration share the same processor objects
+    # C2: Loggers capturing logs for testing never share their capture
+    # C3: Loggers of the same configuration share the same structlog utilities
+    # C4: Repeated assembly of a cached chain does not rebuild it
+    # C5: The cache is bounded
+    # C6: Unhashable filters are assembled without caching
+    """
+    # C1
+    twin_logger = RootLogger(logger_name="twin_logger", logging_variant="basic")
+    processors = root_logger_default_params._configure_processors()
+    twin_processors = twin_logger._configure_processors()
     assert all(
-        extract_name(def_tracker) in processors_names
-        for def_tracker in DEFAULT_TRACKERS
+        _funct is twin_funct
+        for _funct, twin_funct in zip(processors, twin_processors)
+    )
+    # C2
+    local_capture = root_logger_local._configure_processors()[-1]
+    twin_capture = root_logger_local._configure_processors()[-1]
+    assert local_capture is not twin_capture
+    # C3
+    assert twin_logger._utils is root_logger_default_params._utils
+    # C4
+    cache_hits = _build_processors.cache_info().hits
+    for _ in range(TRIALS):
+        twin_logger._configure_processors()
+    assert _build_processors.cache_info().hits == (
+        cache_hits + TRIALS
     )
+    # C5
+    assert _build_processors.cache_info().maxsize is not None
+    # C6
+    tagging_filter = TaggingFilter(tag="run_1")
+    tagged_logger = RootLogger(
+        logger_name="tagged_logger", 
+        logging_variant="basic",
+        filter_functions=[tagging_filter]
+    )
+    cache_info = _build_processors.cache_info()
+    assert tagging_filter in tagged_logger._configure_processors()
+    assert _build_processors.cache_info() == cache_info
 
 
 def test_RootLogger_initialise(root_logger_default_params):
@@ -114,6 +210,10 @@ def test_RootLogger_initialise(root_logger_default_params):
     # C4: root_logger.synlog has processors applied, where processors 
         configured include both default processors and custom processors from 
         self.filter_functions
+    # C5: Repeated .initialise() calls without reconfiguration are no-ops
+    # C6: Reconfigured attributes are applied upon re-initialisation
+        a. logging_level
+        b. filter_functions
     """
     # C1
     assert root_logger_default_params.synlog is None 
@@ -124,21 +224,78 @@ def test_RootLogger_initialise(root_logger_default_params):
     core_logger = logging.getLogger(root_logger_default_params.logger_name)
     assert root_logger_default_params.synlog._logger == core_logger    
     # C4    
-    configured_processors = [
+    configured_processors = {
         extract_name(_funct) 
         for _funct in root_logger_default_params._configure_processors()
-    ]
-    loaded_processors = [
+    }
+    loaded_processors = {
         extract_name(_funct)
         for _funct in root_logger_default_params.synlog._processors
-    ]
-    assert all(                                                            
-        _functname in loaded_processors
-        for _functname in configured_processors
-    )    
+    }
+    assert configured_processors.issubset(loaded_processors)
+    # C5
+    synlog = root_logger_default_params.synlog
+    assert root_logger_default_params.initialise() is synlog
+    # C6a
+    root_logger_default_params.logging_level = logging.WARNING
+    root_logger_default_params.initialise()
+    core_logger = logging.getLogger(root_logger_default_params.logger_name)
+    assert core_logger.level == logging.WARNING
+    # C6b
+    root_logger_default_params.filter_functions = [valid_test_filter]
+    root_logger_default_params.initialise()
+    assert valid_test_filter in root_logger_default_params.synlog._processors
+
+
+def test_RootLogger_initialise_censor_keys(root_logger_local):
+    """
+    Tests that censor keys declared during initialisation are honoured
+
+    # C1: Censor keys declared in .initialise() override those in __init__
+    # C2: Processors initialised censor the declared keys
+    # C3: Nested metadata logged by the caller is left unchanged
+    """
+    root_logger_local.initialise(censor_keys=['secret'])
+    # C1
+    assert root_logger_local.censor_keys == ['secret']
+    assert root_logger_local._utils.censor_keys == ['secret']
+    # C2
+    censor_processor = root_logger_local.synlog._processors[-2]
+    censored_event_dict = censor_processor(None, "info", {'secret': "abc"})
+    assert censored_event_dict['secret'] == CENSOR
+    # C3
+    config = {'secret': "abc"}
+    root_logger_local.synlog.info("Censor test event", config=config)
+    assert config == {'secret': "abc"}
+
+
+def test_RootLogger_context_class():
+    """
+    Tests that bound contexts are held in the specified context class
+
+    # C1: Contexts are held in plain dictionaries by default
+    # C2: Contexts are held in the custom context class specified
+    """
+    # C1
+    default_logger = RootLogger(logger_name="test_default_context_logger")
+    default_logger.initialise()
+    assert type(default_logger.synlog.bind(test_key="test")._context) is dict
+    # C2
+    threadlocal_dict = structlog.threadlocal.wrap_dict(dict)
+    threadlocal_logger = RootLogger(
+        logger_name="test_threadlocal_context_logger",
+        context_class=threadlocal_dict
+    )
+    threadlocal_logger.initialise()
+    bound_logger = threadlocal_logger.synlog.bind(test_key="test")
+    assert isinstance(bound_logger._context, threadlocal_dict)
 
 
-def test_RootLogger_synlog_local_logging(root_logger_local, test_kwargs):
+def test_RootLogger_synlog_local_logging(
+    root_logger_local, 
+    test_kwargs, 
+    captured_entries
+):
     """
     Test output formatting when logging locally across X simulated trials
 
@@ -150,37 +307,45 @@ def test_RootLogger_synlog_local_logging(root_logger_local, test_kwargs):
         b. kwargs_test_int
         c. kwargs_test_float
     """
+    event_msgs = [
+        EVENT_TEMPLATE(trial_idx=trial_idx)
+        for trial_idx in range(TRIALS)
+    ]
     root_logger_local.initialise()
-    with reconfigure_global_structlog_params(root_logger_local) as cap_logs:
-        root_logger_local.synlog.setLevel(logging.INFO) # V.IMPT!!!
-
-        # Simulate X logging statements
-        for trial_idx in range(TRIALS):
-            event_msg = EVENT_TEMPLATE.substitute({'trial_idx': trial_idx})
-            root_logger_local.synlog.info(event_msg, **test_kwargs)
-
-        # C1
-        assert len(cap_logs) == TRIALS              
-        # C2
-        assert all(                                                     
-            set(DEFAULT_SUPPORTED_METADATA).issubset(list(record.keys()))
-            for record in cap_logs
-        )
-
-        for r_idx in range(len(cap_logs)):
-            record = cap_logs[r_idx]
-            # C3
-            assert record.get('logger') == root_logger_local.logger_name
-            assert record.get('file_path') == root_logger_local.file_path
-            level_name = logging.getLevelName(root_logger_local.logging_level)
-            assert record.get('level') == level_name.lower()
-            assert record.get('log_level') == level_name.lower()
-            assert record.get('level_number') == root_logger_local.logging_level
-            assert record.get('timestamp') # needs to be recorded
-            # C4
-            for key, value in test_kwargs.items():
-                assert record.get(key) == value
-        
+    root_logger_local.synlog.setLevel(logging.INFO) # V.IMPT!!!
+
+    # Simulate X logging statements, sharing 1 pre-bound context
+    bound_synlog = root_logger_local.synlog.bind(**test_kwargs)
+    for event_msg in event_msgs:
+        bound_synlog.info(event_msg)
+
+    # C1
+    assert len(captured_entries) == TRIALS              
+    # C2
+    supported_metadata = set(DEFAULT_SUPPORTED_METADATA)
+    assert all(                                                     
+        supported_metadata.issubset(record.keys()) 
+        for record in captured_entries
+    )
+
+    # Expected values are invariant across records (C2 assures presence),
+    # so each metadata field is checked column-wise across all records
+    level_name = logging.getLevelName(root_logger_local.logging_level)
+    expected_metadata = {
+        'logger': root_logger_local.logger_name,
+        'file_path': root_logger_local.file_path,
+        'level': level_name.lower(),
+        'log_level': level_name.lower(),
+        'level_number': root_logger_local.logging_level,
+        **test_kwargs
+    }
+    for key, value in expected_metadata.items():
+        # C3 & C4
+        column = [record.get(key) for record in captured_entries]
+        assert column == [value] * TRIALS
+    # C3 - timestamps need to be recorded
+    assert all(record['timestamp'] for record in captured_entries)
+    
 
 def test_RootLogger_synlog_remote_logging(root_logger_remote):
     """
@@ -198,7 +363,198 @@ def test_RootLogger_synlog_remote_logging(root_logger_remote):
     assert curr_renderer_name == correct_renderer_name
 
 
-def test_RootLogger_valid_filter(root_logger_custom_filters_valid):
+def test_RootLogger_remote_handler_offloading(root_logger_remote):
+    """
+    Tests that remote logging is offloaded to a pooled background listener
+
+    # C1: Only a single queue-backed handler is attached to the core logger
+    # C2: A running listener is pooled under the logger's connection setup
+    # C3: Re-initialising an identical logger of the same name reuses the
+        existing handler & listener
+    # C4: Loggers of different names but the same setup share the connection
+    # C5: Loggers of a different setup open a separate connection
+    # C6: Connections no longer attached to any logger are stopped & discarded
+    """
+    root_logger_remote.initialise()
+    core_logger = logging.getLogger(root_logger_remote.logger_name)
+    # C1
+    assert len(core_logger.handlers) == 1
+    assert isinstance(core_logger.handlers[0], QueueHandler)
+    # C2
+    connection_signature = root_logger_remote._get_connection_signature()
+    listener = RootLogger._connection_pool[connection_signature]
+    assert listener._thread.is_alive()
+    assert core_logger.handlers[0].queue is listener.queue
+    # C3
+    handler = core_logger.handlers[0]
+    identical_logger = RootLogger(
+        server=root_logger_remote.server,
+        port=root_logger_remote.port,
+        logger_name=root_logger_remote.logger_name,
+        logging_variant="graylog"
+    )
+    identical_logger.initialise()
+    assert core_logger.handlers == [handler]
+    assert RootLogger._connection_pool[connection_signature] is listener
+    # C4
+    sibling_logger = RootLogger(
+        server=root_logger_remote.server,
+        port=root_logger_remote.port,
+        logger_name=f"{root_logger_remote.logger_name}_sibling",
+        logging_variant="graylog"
+    )
+    sibling_logger.initialise()
+    sibling_core_logger = logging.getLogger(sibling_logger.logger_name)
+    assert sibling_core_logger.handlers[0] is not handler
+    assert sibling_core_logger.handlers[0].queue is listener.queue
+    # C5
+    different_logger = RootLogger(
+        server=root_logger_remote.server,
+        port=root_logger_remote.port,
+        logger_name=root_logger_remote.logger_name,
+        logging_variant="graylog",
+        buffer_capacity=1
+    )
+    different_logger.initialise()
+    assert len(core_logger.handlers) == 1
+    assert core_logger.handlers[0].queue is not listener.queue
+    assert listener._thread.is_alive() # still serving the sibling logger
+    # C6
+    sibling_logger.buffer_capacity = 1
+    sibling_logger.initialise()
+    assert sibling_core_logger.handlers[0].queue is not listener.queue
+    assert listener._thread is None
+    assert connection_signature not in RootLogger._connection_pool
+
+
+def test_RootLogger_remote_fork_safety(
+    root_logger_remote_gelf, 
+    gelf_tcp_server
+):
+    """
+    Tests that loggers initialised before a fork keep logging in the child
+
+    # C1: Forked children reopen inherited connections with live listeners
+    # C2: Inherited handlers feed the reopened connections
+    # C3: Re-initialising in the child keeps using the reopened connection
+    # C4: Records logged in the child without re-initialising are delivered
+    """
+    root_logger_remote_gelf.initialise()
+    connection_signature = root_logger_remote_gelf._get_connection_signature()
+    listener = RootLogger._connection_pool[connection_signature]
+    core_logger = logging.getLogger(root_logger_remote_gelf.logger_name)
+
+    pid = os.fork()
+    if pid == 0:
+        # Assertions cannot propagate from the child, so outcomes are exited
+        exit_code = 15
+        try:
+            child_listener = RootLogger._connection_pool[connection_signature]
+            is_reopened = (
+                child_listener is not listener and 
+                child_listener._thread.is_alive()
+            )
+            is_requeued = core_logger.handlers[0].queue is child_listener.queue
+            root_logger_remote_gelf.synlog.info("Child test event")
+            root_logger_remote_gelf.initialise()
+            is_reused = (
+                RootLogger._connection_pool[connection_signature] is 
+                child_listener and
+                core_logger.handlers[0].queue is child_listener.queue
+            )
+            RootLogger._close_connection_pool() # drains the child's records
+            exit_code = (
+                int(not is_reopened) + 
+                2 * int(not is_requeued) + 
+                4 * int(not is_reused)
+            )
+        finally:
+            os._exit(exit_code)
+
+    frames = receive_frames(gelf_tcp_server, 1)
+    _, status = os.waitpid(pid, 0)
+    assert os.WIFEXITED(status)
+    exit_code = os.WEXITSTATUS(status)
+    # C1
+    assert not exit_code & 1
+    # C2
+    assert not exit_code & 2
+    # C3
+    assert not exit_code & 4
+    # C4
+    assert [frame['short_message'] for frame in frames] == ["Child test event"]
+
+
+def test_RootLogger_remote_transport(root_logger_remote, root_logger_remote_udp):
+    """
+    Tests that the Graylog handler matches the specified transport
+
+    # C1: "tcp" transport (default) batches records over TCP
+    # C2: "udp" transport sends records over UDP
+    """
+    # C1
+    root_logger_remote.initialise()
+    listener = RootLogger._connection_pool[
+        root_logger_remote._get_connection_signature()
+    ]
+    assert isinstance(listener.handlers[0], GELFTCPBatchHandler)
+    # C2
+    root_logger_remote_udp.initialise()
+    listener = RootLogger._connection_pool[
+        root_logger_remote_udp._get_connection_signature()
+    ]
+    assert isinstance(listener.handlers[0], GELFUDPTunedHandler)
+
+
+def test_RootLogger_gelf_logging(root_logger_remote_gelf, gelf_tcp_server):
+    """
+    Tests that pre-rendered GELF payloads are delivered to the Graylog server
+
+    # C1: Trivial 'gelf' chains are fused into a single pre-rendering GELF 
+        renderer, located at the end of the processors
+    # C2: Payload received is a GELF record of the logged event & metadata
+    """
+    root_logger_remote_gelf.initialise()
+    # C1
+    processors = root_logger_remote_gelf.synlog._processors
+    assert len(processors) == 2
+    assert extract_name(processors[-1]) == "gelf_fast_renderer"
+    # C2
+    root_logger_remote_gelf.synlog.info("GELF test event", test_key="test")
+    frame, = receive_frames(gelf_tcp_server, 1)
+    assert frame['short_message'] == "GELF test event"
+    assert frame['_logger'] == root_logger_remote_gelf.logger_name
+    assert frame['_test_key'] == "test"
+    assert frame['_level_number'] == logging.INFO
+
+
+def test_RootLogger_lazy_imports():
+    """
+    Tests that remote logging dependencies are only loaded when needed
+
+    # C1: graypy is not loaded by basic loggers
+    # C2: psutil is not loaded by non-metric loggers
+    """
+    check_script = (
+        "import sys; "
+        "from synlogger.base import RootLogger; "
+        "RootLogger(logging_variant='basic').initialise(); "
+        "sys.exit({module!r} in sys.modules)"
+    ).format
+    # C1
+    assert subprocess.run(
+        [sys.executable, "-c", check_script(module='graypy')]
+    ).returncode == 0
+    # C2
+    assert subprocess.run(
+        [sys.executable, "-c", check_script(module='psutil')]
+    ).returncode == 0
+
+
+def test_RootLogger_valid_filter(
+    root_logger_custom_filters_valid, 
+    captured_entries
+):
     """
     Tests that filtering functions are applied properly. This test assures that
     a correctly formatted processor will be accepted into the Structlog 
@@ -207,14 +563,11 @@ def test_RootLogger_valid_filter(root_logger_custom_filters_valid):
     # C1: Check that valid filter processor was applied
     """
     root_logger_custom_filters_valid.initialise()
-    with reconfigure_global_structlog_params(
-        root_logger_custom_filters_valid
-    ) as cap_logs:
-        root_logger_custom_filters_valid.synlog.setLevel(logging.INFO)
-        # C1
-        root_logger_custom_filters_valid.synlog.info()
-        record = cap_logs[0]
-        assert record.get('is_valid')
+    root_logger_custom_filters_valid.synlog.setLevel(logging.INFO)
+    # C1
+    root_logger_custom_filters_valid.synlog.info()
+    record = captured_entries[0]
+    assert record.get('is_valid')
 
 
 @pytest.mark.xfail(raises=TypeError)
@@ -231,12 +584,9 @@ def test_RootLogger_invalid_filter_wrong_params(
         processor input
     """
     root_logger_custom_filters_wrong_params.initialise()
-    with reconfigure_global_structlog_params(
-        root_logger_custom_filters_wrong_params
-    ) as _:
-        root_logger_custom_filters_wrong_params.synlog.setLevel(logging.INFO)
-        # C1
-        root_logger_custom_filters_wrong_params.synlog.info()
+    root_logger_custom_filters_wrong_params.synlog.setLevel(logging.INFO)
+    # C1
+    root_logger_custom_filters_wrong_params.synlog.info()
 
 
 @pytest.mark.xfail(raises=TypeError)
@@ -251,9 +601,6 @@ def test_RootLogger_invalid_filter_wrong_outputs(
         caught, due to incompatible processor output
     """
     root_logger_custom_filters_wrong_outputs.initialise()
-    with reconfigure_global_structlog_params(
-        root_logger_custom_filters_wrong_outputs
-    ) as _:
-        root_logger_custom_filters_wrong_outputs.synlog.setLevel(logging.INFO)
-        # C1
-        root_logger_custom_filters_wrong_outputs.synlog.info()
\ No newline at end of file
+    root_logger_custom_filters_wrong_outputs.synlog.setLevel(logging.INFO)
+    # C1
+    root_logger_custom_filters_wrong_outputs.synlog.info()
\ No newline at end of file
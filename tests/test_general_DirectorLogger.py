@@ -11,7 +11,11 @@ import logging
 
 
 # Custom
-from synlogger.config import DIRECTOR_PREFIX, DIRECTOR_PORT
+from synlogger.config import (
+    DIRECTOR_PREFIX, 
+    DIRECTOR_PORT, 
+    DIRECTOR_NAME_TEMPLATE
+)
 
 ##################
 # Configurations #
@@ -37,6 +41,9 @@ def test_DirectorLogger_default_attibutes(director_logger):
     """
     # C1
     assert DIRECTOR_PREFIX in director_logger.logger_name
+    assert director_logger.logger_name == DIRECTOR_NAME_TEMPLATE.substitute(
+        name="Test_director_logger"
+    )
     # C2       
     assert director_logger.logging_variant == "basic"
     # C3        
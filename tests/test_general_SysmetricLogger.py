@@ -20,9 +20,9 @@ from conftest import (
     SYSMETRIC_TRACKERS,
     DURATION,
     POLL_INTERVAL,
-    extract_name,
-    reconfigure_global_structlog_params
+    extract_name
 )
+import synlogger.utils
 from synlogger.config import SYSMETRICS_PREFIX, SYSMETRICS_PORT
 from synlogger.utils import StructlogUtils
 
@@ -35,6 +35,25 @@ file_path = os.path.abspath(__file__)
 class_name = "SysmetricLoggerTest"
 function_name = "test_SysmetricLogger_initialise"
 
+# Expected datatypes of the metadata logged by each sysmetric probe
+SYSMETRIC_DATATYPES = {
+    'timestamp': str,
+    'ID_path': str,
+    'ID_class': str,
+    'ID_function': str,
+    'cpu_percent': float,
+    **dict.fromkeys(
+        [
+            'memory_total', 'memory_available', 'memory_used', 'memory_free',
+            'disk_read_counter', 'disk_write_counter', 
+            'disk_read_bytes', 'disk_write_bytes',
+            'net_bytes_sent', 'net_bytes_recv', 
+            'net_packets_sent', 'net_packets_recv'
+        ], 
+        int
+    )
+}
+
 ###########################
 # Tests - SysmetricLogger #
 ###########################
@@ -51,6 +70,8 @@ def test_SysmetricLogger_default_attibutes(sysmetric_logger_default_params):
     # C6: debugging_fields defaults to False
     # C7: filter_functions defaults to an empty list
     # C8: censor_keys defaults to an empty list (i.e. no information censored)
+    # C9: Probe records are batched in smaller batches, flushed more often 
+        than other loggers
     """
     # C1
     assert SYSMETRICS_PREFIX in sysmetric_logger_default_params.logger_name
@@ -68,15 +89,23 @@ def test_SysmetricLogger_default_attibutes(sysmetric_logger_default_params):
     assert len(sysmetric_logger_default_params.filter_functions) == 0  
     # C8       
     assert len(sysmetric_logger_default_params.censor_keys) == 0 
+    # C9
+    assert sysmetric_logger_default_params.buffer_capacity == 64
+    assert sysmetric_logger_default_params.flush_interval == 0.5
 
 
-def test_SysmetricLogger_configure_processors(sysmetric_logger_default_params):
+def test_SysmetricLogger_configure_processors(
+    sysmetric_logger_default_params,
+    sysmetric_logger
+):
     """
     Tests if sysmetric processors loaded are valid
 
     # C1: All processors returned are functions
     # C2: logging_renderer must be the last processor of the list
     # C3: Sysmetric processors must be included alongside default processors
+        for non-trivial configurations
+    # C4: level filtering must be the first processor of the list
     """
     # C1
     processors = sysmetric_logger_default_params._configure_processors()
@@ -87,15 +116,46 @@ def test_SysmetricLogger_configure_processors(sysmetric_logger_default_params):
         extract_name(last_processor) == extract_name(_funct)
         for _funct in [
             StructlogUtils.graypy_structlog_processor,
-            structlog.processors.JSONRenderer(indent=1)
+            StructlogUtils.orjson_renderer,
+            StructlogUtils.basic_fast_renderer
         ]
     )
     # C3
-    processors_names = [extract_name(processor) for processor in processors]
-    assert all(
-        extract_name(sys_tracker) in processors_names
-        for sys_tracker in SYSMETRIC_TRACKERS
-    )
+    full_processors = sysmetric_logger._configure_processors()
+    processors_names = {extract_name(processor) for processor in full_processors}
+    assert {
+        extract_name(sys_tracker) for sys_tracker in SYSMETRIC_TRACKERS
+    }.issubset(processors_names)
+    # C4
+    assert processors[0] is structlog.stdlib.filter_by_level
+    assert full_processors[0] is structlog.stdlib.filter_by_level
+
+
+def test_SysmetricLogger_level_gating(
+    sysmetric_logger, 
+    monkeypatch, 
+    captured_entries
+):
+    """
+    Tests that system statistics are never probed for filtered events
+
+    # C1: Events below the logging level are dropped before any probing
+    # C2: Events at/above the logging level are probed & logged
+    """
+    def fail_probe():
+        raise AssertionError("System statistics probed for a filtered event")
+
+    sysmetric_logger.initialise()
+    sysmetric_logger.synlog.setLevel(logging.WARNING)
+    # C1
+    with monkeypatch.context() as patch:
+        patch.setattr("synlogger.utils.get_io_counters", fail_probe)
+        sysmetric_logger.synlog.info("Filtered test event")
+    assert len(captured_entries) == 0
+    # C2
+    sysmetric_logger.synlog.warning("Probed test event")
+    assert len(captured_entries) == 1
+    assert 'cpu_percent' in captured_entries[0]
 
 
 def test_SysmetricLogger_is_tracking(sysmetric_logger):
@@ -124,13 +184,48 @@ def test_SysmetricLogger_is_tracking(sysmetric_logger):
     assert sysmetric_logger.is_tracking() == False
 
 
-def test_SysmetricLogger_track(sysmetric_logger):
+def test_SysmetricLogger_track_cpu_sampler(sysmetric_logger, monkeypatch):
+    """
+    Tests if tracking starts the CPU sampler at the tracker's resolution, when
+    no sampler is running yet (i.e. from a clean state)
+
+    # C1: A sampler is started upon tracking
+    # C2: The sampler started samples at the tracker's polling interval
+    """
+    # Sampling is recorded instead of performed, so that no other sampler 
+    # contends with the session's own sampler
+    resolutions = []
+    monkeypatch.setattr("synlogger.utils._cpu_sampler", None)
+    monkeypatch.setattr("synlogger.utils._cpu_sampler_resolution", None)
+    monkeypatch.setattr(
+        "synlogger.utils._sample_cpu_periodically", 
+        lambda resolution, stop: resolutions.append(resolution)
+    )
+    sysmetric_logger.track(
+        file_path=file_path,
+        class_name=class_name,
+        function_name=function_name,
+        resolution=POLL_INTERVAL
+    )
+    sysmetric_logger.terminate()
+    # C1
+    sampler = synlogger.utils._cpu_sampler
+    assert sampler is not None
+    sampler.join()
+    # C2
+    assert resolutions == [POLL_INTERVAL]
+
+
+def test_SysmetricLogger_track(
+    sysmetric_logger, 
+    captured_entries
+):
     """ 
     Tests if sysmetric process tracking starts & polls correctly
 
     # C1: Before tracking is initialised, sysmetric_logger.tracker is None
     # C2: After tracking is initialised, sysmetric_logger.tracker is not None
-    # C3: After tracking is initialised, tracking process is actively running
+    # C3: After tracking is initialised, tracking task is actively running
     # C4: No. of trials recorded tallies with expected no. of records given
         a predetermined polling interval over a specified duration
     # C5: Each record detected has the appropriate metadata logged
@@ -139,7 +234,11 @@ def test_SysmetricLogger_track(sysmetric_logger):
     # C1
     assert sysmetric_logger.tracker is None
 
-    # Start tracking process to check for state changes
+    sysmetric_logger.initialise()
+    sysmetric_logger.synlog.setLevel(logging.INFO) # V.IMPT!!!
+
+    # Records are captured straight from the background tracker, which 
+    # probes within the same process
     sysmetric_logger.track(
         file_path=file_path,
         class_name=class_name,
@@ -150,82 +249,39 @@ def test_SysmetricLogger_track(sysmetric_logger):
     # C2
     assert sysmetric_logger.tracker is not None
     # C3
-    assert sysmetric_logger.tracker.is_alive()
-
-    with reconfigure_global_structlog_params(sysmetric_logger) as cap_logs:
-        sysmetric_logger.synlog.setLevel(logging.INFO) # V.IMPT!!!
-
-        ###########################
-        # Implementation Footnote #
-        ###########################
-
-        # [Cause]
-        # Structlog's log capture mechanism does not allow for log capturing
-        # from multiprocessed loggers with custom processors (i.e. non-global).
-
-        # [Problems]
-        # Sysmetric tracking is performed by running a backgrounded process
-        # polling for logs once every specified interval. Being a struclog
-        # logger, it suffers from the aforementioned limitations DURING TESTING.
-        # This results in the failure to capture logs for analysis/testing.
-
-        # [Solution]
-        # Manually simulate probing behaviour in the global context, using
-        # custom processors that are same as the ones running in the 
-        # backgrounded logger.
-
-        trial_count = int(DURATION/POLL_INTERVAL)
-        for _ in range(trial_count):
-            sysmetric_logger._probe(
-                resolution=POLL_INTERVAL,
-                descriptors={
-                    "ID_path": file_path,
-                    "ID_class": class_name,
-                    "ID_function": function_name
-                }
-            )
-
-        # C4
-        assert len(cap_logs) == trial_count
-        # C5
-        assert all(                                                     
-            set(SYSMETRIC_SUPPORTED_METADATA).issubset(list(record.keys()))
-            for record in cap_logs
-        )
+    assert not sysmetric_logger.tracker.done()
+
+    time.sleep(DURATION)
+    sysmetric_logger.terminate()
+
+    # Termination itself is logged after the last probe
+    termination_log = captured_entries.pop()
+    assert termination_log['event'].startswith("Tracking terminated")
 
-        for record in cap_logs:
-            # C6
-            assert record.get('logger') == sysmetric_logger.logger_name
-            assert record.get('file_path') == sysmetric_logger.file_path
-            level_name = logging.getLevelName(sysmetric_logger.logging_level)
-            assert record.get('level') == level_name.lower()
-            assert record.get('log_level') == level_name.lower()
-            assert record.get('level_number') == sysmetric_logger.logging_level
-            assert isinstance(record.get('timestamp'), str)
-            assert isinstance(record.get('ID_path'), str)
-            assert isinstance(record.get('ID_class'), str)
-            assert isinstance(record.get('ID_function'), str)
-            assert isinstance(record.get('cpu_percent'), float)
-            assert isinstance(record.get('memory_total'), int)
-            assert isinstance(record.get('memory_available'), int)
-            assert isinstance(record.get('memory_used'), int)
-            assert isinstance(record.get('memory_free'), int)
-            assert isinstance(record.get('disk_read_counter'), int)
-            assert isinstance(record.get('disk_write_counter'), int)
-            assert isinstance(record.get('disk_read_bytes'), int)
-            assert isinstance(record.get('disk_write_bytes'), int)
-            assert isinstance(record.get('net_bytes_sent'), int)
-            assert isinstance(record.get('net_bytes_recv'), int)
-            assert isinstance(record.get('net_packets_sent'), int)
-            assert isinstance(record.get('net_packets_recv'), int)
-
-        # Manually clean up process (no dependency on .terminate())                    
-        sysmetric_logger.tracker.terminate() # send SIGTERM signal to the child
-        sysmetric_logger.tracker.join()
-        exit_code = sysmetric_logger.tracker.exitcode
-        sysmetric_logger.tracker.close()
-        sysmetric_logger.tracker = None      # Reset state of tracker
-        # assert exit_code == 0                # successful termination    
+    # C4 - tolerates scheduling jitter of up to 1 polling interval
+    trial_count = int(DURATION/POLL_INTERVAL)
+    assert trial_count - 1 <= len(captured_entries) <= trial_count + 1
+    # C5
+    supported_metadata = set(SYSMETRIC_SUPPORTED_METADATA)
+    assert all(                                                     
+        supported_metadata.issubset(record.keys()) 
+        for record in captured_entries
+    )
+
+    # Expected values are invariant across records
+    logging_level = sysmetric_logger.logging_level
+    level_name = logging.getLevelName(logging_level).lower()
+    for record in captured_entries:
+        # C6
+        assert record.get('logger') == sysmetric_logger.logger_name
+        assert record.get('file_path') == sysmetric_logger.file_path
+        assert record.get('level') == level_name
+        assert record.get('log_level') == level_name
+        assert record.get('level_number') == logging_level
+        assert all(
+            isinstance(record.get(key), datatype)
+            for key, datatype in SYSMETRIC_DATATYPES.items()
+        )
 
 
 def test_SysmetricLogger_terminate(sysmetric_logger):
@@ -233,7 +289,7 @@ def test_SysmetricLogger_terminate(sysmetric_logger):
     Tests if sysmetric process tracking terminates correctly
 
     # C1: Before tracking is terminated, sysmetric_logger.tracker is not None
-    # C2: Before tracking is terminated, tracking process is actively running
+    # C2: Before tracking is terminated, tracking task is actively running
     # C3: After tracking is terminated, sysmetric_logger.tracker is None
     # C4: After tracking is terminated, saved tracker is no longer running
     # C5: Tracking was terminated gracefully
@@ -249,7 +305,7 @@ def test_SysmetricLogger_terminate(sysmetric_logger):
     # C1
     assert sysmetric_logger.tracker is not None
     # C2
-    assert sysmetric_logger.tracker.is_alive()
+    assert not sysmetric_logger.tracker.done()
     
     saved_tracker = sysmetric_logger.tracker
     exit_code = sysmetric_logger.terminate()
@@ -257,11 +313,64 @@ def test_SysmetricLogger_terminate(sysmetric_logger):
     # C3
     assert sysmetric_logger.tracker is None
     # C4
-    assert saved_tracker._closed
+    assert saved_tracker.done()
     # C5
     assert exit_code == 0
 
 
+def test_SysmetricLogger_abnormal_termination(
+    sysmetric_logger, 
+    monkeypatch, 
+    captured_entries
+):
+    """
+    Tests if abnormal terminations are reported via non-zero exit codes, 
+    instead of raising or hanging
+
+    # C1: Cancelled tracking tasks terminate with an exit code of 1
+    # C2: Tracking tasks not winding down in time terminate with an exit code
+        of 2
+    # C3: Tracking tasks that died are no longer considered to be tracking
+    # C4: Failures of dead tracking tasks are logged upon termination, with an
+        exit code of 1
+    """
+    track_kwargs = {
+        'file_path': file_path,
+        'class_name': class_name,
+        'function_name': function_name,
+        'resolution': POLL_INTERVAL
+    }
+    # C1
+    tracker = sysmetric_logger.track(**track_kwargs)
+    tracker.get_loop().call_soon_threadsafe(tracker.cancel)
+    time.sleep(POLL_INTERVAL)
+    assert sysmetric_logger.terminate() == 1
+    # C2
+    monkeypatch.setattr(
+        "synlogger.general.TERMINATION_TIMEOUT", 
+        POLL_INTERVAL
+    )
+    tracker = sysmetric_logger.track(**track_kwargs)
+    tracker.get_loop().call_soon_threadsafe(time.sleep, 5 * POLL_INTERVAL)
+    assert sysmetric_logger.terminate() == 2
+    time.sleep(10 * POLL_INTERVAL) # lets the stalled loop catch up
+    assert tracker.done()
+    # C3
+    def fail_probe(*args, **kwargs):
+        raise RuntimeError("Failed probe")
+
+    monkeypatch.setattr(sysmetric_logger, "_probe", fail_probe)
+    sysmetric_logger.track(**track_kwargs)
+    time.sleep(POLL_INTERVAL)
+    assert not sysmetric_logger.is_tracking()
+    # C4
+    sysmetric_logger.initialise()
+    assert sysmetric_logger.terminate() == 1
+    failure_log, termination_log = captured_entries[-2:]
+    assert failure_log['event'] == "Tracking failed with RuntimeError"
+    assert "Failed probe" in failure_log['exception']
+
+
 @pytest.mark.xfail(raises=RuntimeError)
 def test_SysmetricLogger_premature_termination(sysmetric_logger):
     """
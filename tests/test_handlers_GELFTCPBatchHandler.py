@@ -0,0 +1,123 @@
+#!/usr/bin/env python
+
+####################
+# Required Modules #
+####################
+
+# Generic/Built-in
+import datetime
+import json
+import logging
+import socket
+
+# Libs
+
+
+# Custom
+from conftest import TRIALS, EVENT_TEMPLATE, make_record, receive_frames
+
+
+##################
+# Configurations #
+##################
+
+
+###############################
+# Tests - GELFTCPBatchHandler #
+###############################
+
+def test_GELFTCPBatchHandler_buffering(gelf_tcp_batch_handler):
+    """
+    Tests that records are held back until the buffer is full
+
+    # C1: Records below capacity are buffered and not sent
+    # C2: Reaching capacity flushes the entire buffer
+    """
+    for trial_idx in range(TRIALS - 1):
+        event_msg = EVENT_TEMPLATE(trial_idx=trial_idx)
+        gelf_tcp_batch_handler.handle(make_record(event_msg))
+    # C1
+    assert len(gelf_tcp_batch_handler.buffer) == TRIALS - 1
+    # C2
+    gelf_tcp_batch_handler.handle(make_record("Final test event"))
+    assert len(gelf_tcp_batch_handler.buffer) == 0
+
+
+def test_GELFTCPBatchHandler_flush_level(gelf_tcp_batch_handler):
+    """
+    Tests that high-severity records are dispatched immediately
+
+    # C1: Records at/above flush_level trigger a flush of the buffer
+    """
+    gelf_tcp_batch_handler.handle(make_record("Info event"))
+    gelf_tcp_batch_handler.handle(make_record("Error event", logging.ERROR))
+    # C1
+    assert len(gelf_tcp_batch_handler.buffer) == 0
+
+
+def test_GELFTCPBatchHandler_batched_send(
+    gelf_tcp_server,
+    gelf_tcp_batch_handler
+):
+    """
+    Tests that batched GELF frames are received intact and in order
+
+    # C1: All records are received by the Graylog server
+    # C2: Each frame received is a valid GELF record, in logged order
+    """
+    for trial_idx in range(TRIALS):
+        event_msg = EVENT_TEMPLATE(trial_idx=trial_idx)
+        gelf_tcp_batch_handler.handle(make_record(event_msg))
+
+    frames = receive_frames(gelf_tcp_server, TRIALS)
+    # C1
+    assert len(frames) == TRIALS
+    # C2
+    for trial_idx, frame in enumerate(frames):
+        event_msg = EVENT_TEMPLATE(trial_idx=trial_idx)
+        assert frame['short_message'] == event_msg
+
+
+def test_GELFTCPBatchHandler_socket_options(
+    gelf_tcp_server,
+    gelf_tcp_batch_handler
+):
+    """
+    Tests that the connection to Graylog is tuned for small, sporadic frames
+
+    # C1: Nagle's algorithm is disabled (i.e. TCP_NODELAY is set)
+    # C2: TCP keepalives are enabled
+    """
+    tcp_socket = gelf_tcp_batch_handler.makeSocket()
+    try:
+        # C1
+        assert tcp_socket.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY)
+        # C2
+        assert tcp_socket.getsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE)
+    finally:
+        tcp_socket.close()
+
+
+def test_GELFTCPBatchHandler_orjson_packing(gelf_tcp_batch_handler):
+    """
+    Tests that GELF dictionaries are serialised into valid compact JSON
+
+    # C1: Packed GELF log is a valid JSON-encoded byte string
+    # C2: Byte strings & datetimes are serialised into strings
+    # C3: Packed GELF log is not pretty-printed
+    """
+    timestamp = datetime.datetime(2020, 10, 21, 5, 9, 10)
+    packed = gelf_tcp_batch_handler._pack_gelf_dict({
+        'short_message': b"Packing test event",
+        '_timestamp': timestamp,
+        '_count': 42
+    })
+    # C1
+    assert isinstance(packed, bytes)
+    gelf_dict = json.loads(packed)
+    # C2
+    assert gelf_dict['short_message'] == "Packing test event"
+    assert gelf_dict['_timestamp'] == timestamp.isoformat()
+    assert gelf_dict['_count'] == 42
+    # C3
+    assert b" " not in packed.replace(b"Packing test event", b"")
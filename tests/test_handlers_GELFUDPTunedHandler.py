@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+
+####################
+# Required Modules #
+####################
+
+# Generic/Built-in
+import json
+import logging
+import socket
+import zlib
+
+# Libs
+
+
+# Custom
+
+
+##################
+# Configurations #
+##################
+
+
+###############################
+# Tests - GELFUDPTunedHandler #
+###############################
+
+def test_GELFUDPTunedHandler_send_buffer(gelf_udp_tuned_handler):
+    """
+    Tests that the UDP socket is created with an enlarged send buffer
+
+    # C1: Socket created is a UDP socket
+    # C2: Socket's send buffer exceeds the system default
+    """
+    default_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    default_size = default_socket.getsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF)
+    default_socket.close()
+
+    udp_socket = gelf_udp_tuned_handler.makeSocket()
+    # C1
+    assert udp_socket.type == socket.SOCK_DGRAM
+    # C2
+    tuned_size = udp_socket.getsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF)
+    assert tuned_size > default_size
+    udp_socket.close()
+
+
+def test_GELFUDPTunedHandler_send(gelf_udp_server, gelf_udp_tuned_handler):
+    """
+    Tests that records are received as valid GELF datagrams
+
+    # C1: Datagram received decodes into a GELF record of the logged message
+    """
+    record = logging.LogRecord(
+        name="test_udp_handler",
+        level=logging.INFO,
+        pathname=__file__,
+        lineno=0,
+        msg="UDP test event",
+        args=None,
+        exc_info=None
+    )
+    gelf_udp_tuned_handler.handle(record)
+    datagram, _ = gelf_udp_server.recvfrom(65536)
+    # C1
+    frame = json.loads(zlib.decompress(datagram))
+    assert frame['short_message'] == "UDP test event"
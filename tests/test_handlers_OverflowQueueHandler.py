@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+
+####################
+# Required Modules #
+####################
+
+# Generic/Built-in
+import logging
+import threading
+
+# Libs
+
+
+# Custom
+from conftest import TRIALS, EVENT_TEMPLATE, make_record
+
+
+##################
+# Configurations #
+##################
+
+
+################################
+# Tests - OverflowQueueHandler #
+################################
+
+def test_OverflowQueueHandler_enqueue(overflow_queue_handler):
+    """
+    Tests that records are queued as per normal while there is space
+
+    # C1: All records are enqueued in order without any drops
+    """
+    for trial_idx in range(TRIALS):
+        event_msg = EVENT_TEMPLATE(trial_idx=trial_idx)
+        overflow_queue_handler.handle(make_record(event_msg))
+    # C1
+    log_queue = overflow_queue_handler.queue
+    assert log_queue.qsize() == TRIALS
+    assert overflow_queue_handler.dropped == 0
+    assert log_queue.get_nowait().getMessage() == EVENT_TEMPLATE(trial_idx=0)
+
+
+def test_OverflowQueueHandler_backpressure(overflow_queue_handler):
+    """
+    Tests that low-severity records are shed when the queue is full, while
+    high-severity records are retained
+
+    # C1: Records below overflow_level are dropped when the queue is full
+    # C2: Records at/above overflow_level wait for space in the queue
+    """
+    for trial_idx in range(TRIALS):
+        event_msg = EVENT_TEMPLATE(trial_idx=trial_idx)
+        overflow_queue_handler.handle(make_record(event_msg))
+    # C1
+    overflow_queue_handler.handle(make_record("Dropped event", logging.DEBUG))
+    overflow_queue_handler.handle(make_record("Dropped event", logging.INFO))
+    log_queue = overflow_queue_handler.queue
+    assert overflow_queue_handler.dropped == 2
+    assert log_queue.qsize() == TRIALS
+    # C2
+    consumer = threading.Timer(0.1, log_queue.get_nowait)
+    consumer.start()
+    overflow_queue_handler.handle(make_record("Kept event", logging.ERROR))
+    consumer.join()
+    assert overflow_queue_handler.dropped == 2
+    assert log_queue.qsize() == TRIALS
+    *_, last_record = [log_queue.get_nowait() for _ in range(TRIALS)]
+    assert last_record.getMessage() == "Kept event"
+
+
+def test_OverflowQueueHandler_overflow_timeout(overflow_queue_handler, capsys):
+    """
+    Tests that high-severity records never block indefinitely on a stalled
+    queue, and that shedding is reported
+
+    # C1: Records at/above overflow_level are dropped once overflow_timeout
+        lapses without space freeing up
+    # C2: The 1st drop is reported to stderr
+    # C3: Subsequent drops are only reported upon closing, with the total
+    """
+    overflow_queue_handler.overflow_timeout = 0.1
+    for trial_idx in range(TRIALS):
+        event_msg = EVENT_TEMPLATE(trial_idx=trial_idx)
+        overflow_queue_handler.handle(make_record(event_msg))
+    # C1
+    overflow_queue_handler.handle(make_record("Stalled event", logging.ERROR))
+    assert overflow_queue_handler.dropped == 1
+    assert overflow_queue_handler.queue.qsize() == TRIALS
+    # C2
+    assert "dropped 1 record(s)" in capsys.readouterr().err
+    # C3
+    overflow_queue_handler.handle(make_record("Dropped event", logging.INFO))
+    assert capsys.readouterr().err == ""
+    overflow_queue_handler.close()
+    assert "dropped 2 record(s)" in capsys.readouterr().err
@@ -5,16 +5,21 @@
 ####################
 
 # Generic/Built-in
+import json
 import logging
+import threading
+import time
 from datetime import datetime
 from attr import dataclass
 
 # Libs
+import psutil
 import pytest
 import structlog
 
 # Custom
-from synlogger.config import CENSOR
+import synlogger.utils
+from synlogger.config import CENSOR, TIMESTAMP_FORMAT
 
 
 ##################
@@ -41,6 +46,70 @@ def test_StructlogUtils_default_attibutes(structlog_utils_default_params):
     assert structlog_utils_default_params.file_path == ""
 
 
+def test_StructlogUtils_add_log_level_number(structlog_utils, event_kwargs):
+    """
+    Tests if the numeric logging level is logged automatically
+
+    # C1: Checks if level numbers correspond to the stdlib logging levels
+    # C2: Checks if unknown levels default to logging.NOTSET
+    """
+    # C1
+    for level_name in ['debug', 'info', 'warning', 'error', 'critical']:
+        augmented_event_dict = structlog_utils.add_log_level_number(
+            logger,
+            method,
+            event_dict={**event_kwargs, 'level': level_name}
+        )
+        assert augmented_event_dict['level_number'] == getattr(
+            logging, 
+            level_name.upper()
+        )
+    # C2
+    augmented_event_dict = structlog_utils.add_log_level_number(
+        logger,
+        method,
+        event_dict=dict(event_kwargs)
+    )
+    assert augmented_event_dict['level_number'] == logging.NOTSET
+
+
+def test_StructlogUtils_format_exc_and_stack_info(structlog_utils, event_kwargs):
+    """
+    Tests if exception & stack information are rendered only when requested
+
+    # C1: Checks that plain events are returned untouched
+    # C2: Checks that exception information is rendered into a traceback
+    # C3: Checks that stack information is rendered into a stack trace
+    """
+    # C1
+    plain_event_dict = dict(event_kwargs)
+    augmented_event_dict = structlog_utils.format_exc_and_stack_info(
+        logger,
+        method,
+        event_dict=plain_event_dict
+    )
+    assert augmented_event_dict == event_kwargs
+    # C2
+    try:
+        raise ValueError("Test exception")
+    except ValueError:
+        augmented_event_dict = structlog_utils.format_exc_and_stack_info(
+            logger,
+            method,
+            event_dict={**event_kwargs, 'exc_info': True}
+        )
+    assert 'exc_info' not in augmented_event_dict
+    assert "ValueError: Test exception" in augmented_event_dict['exception']
+    # C3
+    augmented_event_dict = structlog_utils.format_exc_and_stack_info(
+        logger,
+        method,
+        event_dict={**event_kwargs, 'stack_info': True}
+    )
+    assert 'stack_info' not in augmented_event_dict
+    assert augmented_event_dict['stack']
+
+
 def test_StructlogUtils_censor_logging(
     structlog_utils_with_censors,
     event_kwargs
@@ -49,18 +118,39 @@ def test_StructlogUtils_censor_logging(
     Tests if log censoring is functioning correctly
 
     # C1: Checks if specified censors are applied to their respective keys
+    # C2: Checks if specified censors are applied within nested metadata
+    # C3: Checks that nested metadata passed in by the caller is left unchanged
     """
     # C1
     censored_keys = structlog_utils_with_censors.censor_keys
     censored_event_dict = structlog_utils_with_censors.censor_logging(
         logger,
         method,
-        event_dict=event_kwargs
+        event_dict=dict(event_kwargs)
     )
     assert all(
         censored_event_dict.get(key) == CENSOR
         for key in censored_keys
     )
+    # C2
+    censored_event_dict = structlog_utils_with_censors.censor_logging(
+        logger,
+        method,
+        event_dict={'nested': {'inner': dict(event_kwargs)}}
+    )
+    nested_event_dict = censored_event_dict['nested']['inner']
+    assert all(
+        nested_event_dict.get(key) == CENSOR
+        for key in censored_keys
+    )
+    # C3
+    caller_dict = {'inner': dict(event_kwargs)}
+    structlog_utils_with_censors.censor_logging(
+        logger,
+        method,
+        event_dict={'nested': caller_dict}
+    )
+    assert caller_dict == {'inner': event_kwargs}
 
 
 def test_StructlogUtils_get_file_path(structlog_utils, event_kwargs):
@@ -78,6 +168,33 @@ def test_StructlogUtils_get_file_path(structlog_utils, event_kwargs):
     assert augmented_event_dict.get('file_path') == structlog_utils.file_path
 
 
+def test_StructlogUtils_add_file_path_and_censor(
+    structlog_utils_with_censors,
+    event_kwargs
+):
+    """
+    Tests if file path stamping & log censoring are applied in a single call
+
+    # C1: Checks if file path is added to the event dictionary
+    # C2: Checks if specified censors are applied to their respective keys
+    """
+    augmented_event_dict = structlog_utils_with_censors.add_file_path_and_censor(
+        logger,
+        method,
+        event_dict=dict(event_kwargs)
+    )
+    # C1
+    assert (
+        augmented_event_dict.get('file_path') == 
+        structlog_utils_with_censors.file_path
+    )
+    # C2
+    assert all(
+        augmented_event_dict.get(key) == CENSOR
+        for key in structlog_utils_with_censors.censor_keys
+    )
+
+
 def test_StructlogUtils_add_timestamp(structlog_utils, event_kwargs):
     """
     Tests if timestamp is logged automatically
@@ -94,7 +211,26 @@ def test_StructlogUtils_add_timestamp(structlog_utils, event_kwargs):
     # C1
     assert timestamp
     # C2
-    assert isinstance(timestamp, datetime)
+    assert isinstance(timestamp, float)
+
+
+def test_StructlogUtils_add_cached_timestamp(structlog_utils, event_kwargs):
+    """
+    Tests if a formatted timestamp is logged automatically
+
+    # C1: Checks if timestamp is added to the event dictionary
+    # C2: Checks if timestamp added follows the configured format
+    """
+    augmented_event_dict = structlog_utils.add_cached_timestamp(
+        logger,
+        method,
+        event_dict=event_kwargs
+    )
+    timestamp = augmented_event_dict.get('timestamp')
+    # C1
+    assert timestamp
+    # C2
+    assert datetime.strptime(timestamp, TIMESTAMP_FORMAT)
 
 
 def test_StructlogUtils_track_cpu_stats(structlog_utils, event_kwargs):
@@ -110,12 +246,200 @@ def test_StructlogUtils_track_cpu_stats(structlog_utils, event_kwargs):
         event_dict=event_kwargs
     )
     cpu_percent = augmented_event_dict.get('cpu_percent')
-    # C1
-    assert cpu_percent
+    # C1 - an idle system validly reports 0.0
+    assert 'cpu_percent' in augmented_event_dict
     # C2
     assert isinstance(cpu_percent, float)
 
 
+def test_StructlogUtils_cpu_sampler(structlog_utils, event_kwargs):
+    """
+    Tests if CPU utilisation is sampled by a single background sampler
+
+    # C1: Checks if the sampler is running after CPU statistics are tracked
+    # C2: Checks if only 1 sampler is ever started per process
+    # C3: Checks if tracked CPU utilisation is the latest sampled value
+    """
+    structlog_utils.track_cpu_stats(logger, method, event_dict=event_kwargs)
+    sampler = synlogger.utils._cpu_sampler
+    # C1
+    assert sampler.is_alive()
+    # C2
+    assert synlogger.utils.start_cpu_sampler() is sampler
+    # C3
+    augmented_event_dict = structlog_utils.track_cpu_stats(
+        logger,
+        method,
+        event_dict=event_kwargs
+    )
+    assert (
+        augmented_event_dict['cpu_percent'] == 
+        synlogger.utils._cpu_snapshot['cpu_percent']
+    )
+
+
+def test_StructlogUtils_cpu_sampler_stop(monkeypatch):
+    """
+    Tests if the background CPU sampler can be stopped & restarted
+
+    # C1: Checks if a stopped sampler exits its sampling loop
+    # C2: Checks if a new sampler can be started after stopping
+    """
+    # Sampling waits on the stop event instead of reading psutil, so that no
+    # other sampler contends with the session's own sampler
+    monkeypatch.setattr(synlogger.utils, "_cpu_sampler", None)
+    monkeypatch.setattr(synlogger.utils, "_cpu_sampler_resolution", None)
+    monkeypatch.setattr(synlogger.utils, "_cpu_sampler_stop", threading.Event())
+    monkeypatch.setattr(
+        synlogger.utils, 
+        "_sample_cpu_periodically", 
+        lambda resolution, stop: stop.wait()
+    )
+    sampler = synlogger.utils.start_cpu_sampler()
+    # C1
+    synlogger.utils.stop_cpu_sampler()
+    sampler.join(timeout=1)
+    assert not sampler.is_alive()
+    assert synlogger.utils._cpu_sampler is None
+    # C2
+    restarted_sampler = synlogger.utils.start_cpu_sampler()
+    assert restarted_sampler is not sampler
+    assert restarted_sampler.is_alive()
+    synlogger.utils.stop_cpu_sampler()
+    restarted_sampler.join(timeout=1)
+
+
+def test_StructlogUtils_cpu_sampler_resolution(monkeypatch):
+    """
+    Tests if the background CPU sampler samples at the finest resolution 
+    requested
+
+    # C1: Checks if coarser resolutions reuse the running sampler
+    # C2: Checks if finer resolutions restart the sampler at that resolution
+    """
+    # Sampling is recorded instead of performed, so that no other sampler 
+    # contends with the session's own sampler
+    resolutions = []
+    def record_sampling(resolution: float, stop: threading.Event) -> None:
+        resolutions.append(resolution)
+        stop.wait()
+
+    monkeypatch.setattr(synlogger.utils, "_cpu_sampler", None)
+    monkeypatch.setattr(synlogger.utils, "_cpu_sampler_resolution", None)
+    monkeypatch.setattr(synlogger.utils, "_cpu_sampler_stop", threading.Event())
+    monkeypatch.setattr(
+        synlogger.utils, 
+        "_sample_cpu_periodically", 
+        record_sampling
+    )
+    sampler = synlogger.utils.start_cpu_sampler(1.0)
+    # C1
+    assert synlogger.utils.start_cpu_sampler(10.0) is sampler
+    # C2
+    finer_sampler = synlogger.utils.start_cpu_sampler(0.1)
+    sampler.join(timeout=1)
+    assert not sampler.is_alive()
+    assert finer_sampler.is_alive()
+    synlogger.utils.stop_cpu_sampler()
+    finer_sampler.join(timeout=1)
+    assert resolutions == [1.0, 0.1]
+
+
+def test_StructlogUtils_cpu_sampler_warmup(monkeypatch):
+    """
+    Tests if the 1st CPU utilisation reading is published after a warm-up, 
+    instead of a full sampling interval
+
+    # C1: Checks if the sampler waits for the warm-up before its 1st reading,
+        and for the full sampling interval thereafter
+    # C2: Checks if the 1st reading is published after the warm-up
+    """
+    class StopAfterFirstReading:
+        # Stands in for the sampler's stop event, so that its loop runs only
+        # once within the test's own thread
+        def __init__(self):
+            self.timeouts = []
+
+        def wait(self, timeout: float) -> bool:
+            self.timeouts.append(timeout)
+            return len(self.timeouts) > 1
+
+    cpu_snapshot = {'cpu_percent': -1.0}
+    monkeypatch.setattr(synlogger.utils, "_cpu_snapshot", cpu_snapshot)
+    monkeypatch.setattr(psutil, "cpu_percent", lambda interval=None: 42.0)
+    stop = StopAfterFirstReading()
+    synlogger.utils._sample_cpu_periodically(3600, stop)
+    # C1
+    assert stop.timeouts == [synlogger.utils.CPU_WARMUP_INTERVAL, 3600]
+    # C2
+    assert cpu_snapshot['cpu_percent'] == 42.0
+
+
+def test_StructlogUtils_io_counters(
+    structlog_utils, 
+    event_kwargs, 
+    monkeypatch
+):
+    """
+    Tests if DiskIO & NetworkIO statistics are polled at a lower frequency
+
+    # C1: Checks if repeated polls within the resolution reuse 1 snapshot
+    # C2: Checks if a fresh snapshot is taken once the resolution lapses
+    # C3: Checks if tracked IO statistics are the latest snapshots taken
+    """
+    class FrozenClock:
+        # Stands in for the `time` module within synlogger.utils, with a
+        # monotonic clock that is only advanced by the test
+        now = 1000.0
+
+        def monotonic(self) -> float:
+            return self.now
+
+        def __getattr__(self, name: str):
+            return getattr(time, name)
+
+    def count_reads(read_counters):
+        def read():
+            reads.append(read_counters.__name__)
+            return read_counters()
+        return read
+
+    reads = []
+    clock = FrozenClock()
+    monkeypatch.setattr(synlogger.utils, "time", clock)
+    monkeypatch.setattr(
+        synlogger.utils, 
+        "_io_counters", 
+        (float('-inf'), None, None)
+    )
+    for read_counters in (psutil.disk_io_counters, psutil.net_io_counters):
+        monkeypatch.setattr(
+            psutil, 
+            read_counters.__name__, 
+            count_reads(read_counters)
+        )
+    resolution = synlogger.utils.IO_COUNTERS_RESOLUTION
+
+    # C1
+    disk_stats, network_stats = synlogger.utils.get_io_counters()
+    clock.now += resolution / 2
+    assert synlogger.utils.get_io_counters() == (disk_stats, network_stats)
+    assert len(reads) == 2 # 1 DiskIO & 1 NetworkIO read
+    # C2
+    clock.now += resolution / 2
+    disk_stats, network_stats = synlogger.utils.get_io_counters()
+    assert len(reads) == 4
+    # C3
+    augmented_event_dict = structlog_utils.track_system_stats(
+        logger,
+        method,
+        event_dict=event_kwargs
+    )
+    assert len(reads) == 4
+    assert augmented_event_dict['disk_read_bytes'] == disk_stats.read_bytes
+    assert augmented_event_dict['net_bytes_sent'] == network_stats.bytes_sent
+
+
 def test_StructlogUtils_track_memory_stats(structlog_utils, event_kwargs):
     """
     Tests if memory (RAM) meta-statistics are logged automatically 
@@ -198,6 +522,174 @@ def test_StructlogUtils_track_network_stats(structlog_utils, event_kwargs):
         assert isinstance(net_stat, int)
 
 
+def test_StructlogUtils_track_system_stats(structlog_utils, event_kwargs):
+    """
+    Tests if all system meta-statistics are logged in a single pass
+
+    # C1: Checks if all system meta-statistics are added to the event dictionary
+    # C2: Checks if system meta-statistics added are of the correct datatype
+    """
+    augmented_event_dict = structlog_utils.track_system_stats(
+        logger,
+        method,
+        event_dict=dict(event_kwargs)
+    )
+    sys_stat_keys = [
+        'memory_total', 'memory_available', 'memory_used', 'memory_free',
+        'disk_read_counter', 'disk_write_counter', 
+        'disk_read_bytes', 'disk_write_bytes',
+        'net_bytes_sent', 'net_bytes_recv', 
+        'net_packets_sent', 'net_packets_recv'
+    ]
+    # C1
+    assert 'cpu_percent' in augmented_event_dict
+    assert all(key in augmented_event_dict for key in sys_stat_keys)
+    # C2
+    assert isinstance(augmented_event_dict['cpu_percent'], float)
+    assert all(
+        isinstance(augmented_event_dict[key], int) 
+        for key in sys_stat_keys
+    )
+
+
+def test_StructlogUtils_orjson_renderer(structlog_utils, event_kwargs):
+    """
+    Tests if event dictionary is rendered into compact JSON
+
+    # C1: Checks that the rendered output is a string
+    # C2: Checks that the rendered output preserves all logged metadata
+    # C3: Checks that the rendered output is not pretty-printed
+    """
+    rendered = structlog_utils.orjson_renderer(
+        logger,
+        method,
+        event_dict=event_kwargs
+    )
+    # C1
+    assert isinstance(rendered, str)
+    # C2
+    assert json.loads(rendered) == event_kwargs
+    # C3
+    assert "\n" not in rendered
+
+
+def test_StructlogUtils_renderers_unsupported_types(structlog_utils):
+    """
+    Tests that all JSON renderers accept metadata which orjson does not support
+    natively, instead of raising at the logging call site
+
+    # C1: Non-string dictionary keys are stringified
+    # C2: Integers wider than 64 bits are rendered losslessly
+    """
+    renderers = [
+        structlog_utils.orjson_renderer,
+        structlog_utils.basic_fast_renderer,
+        structlog_utils.gelf_renderer
+    ]
+    for renderer in renderers:
+        scores_record = json.loads(
+            renderer(logger, "info", {'event': "Test event", 'scores': {1: 0.9}})
+        )
+        wide_record = json.loads(
+            renderer(logger, "info", {'event': "Test event", 'count': 2**70})
+        )
+        scores = scores_record.get('scores', scores_record.get('_scores'))
+        count = wide_record.get('count', wide_record.get('_count'))
+        # C1
+        assert scores == {'1': 0.9}
+        # C2
+        assert count == 2**70
+
+
+def test_StructlogUtils_basic_fast_renderer(structlog_utils, event_kwargs):
+    """
+    Tests if the fused 'basic' renderer stamps & renders all default metadata
+
+    # C1: Checks that the rendered output is a string
+    # C2: Checks that default metadata is stamped with valid values
+    # C3: Checks that all logged metadata is preserved
+    """
+    rendered = structlog_utils.basic_fast_renderer(
+        logger,
+        "warn",
+        event_dict={'event': "Test event", **event_kwargs}
+    )
+    # C1
+    assert isinstance(rendered, str)
+    # C2
+    record = json.loads(rendered)
+    assert record['event'] == "Test event"
+    assert record['logger'] == logger.name
+    assert record['level'] == "warning"
+    assert record['level_number'] == logging.WARNING
+    assert isinstance(record['timestamp'], str)
+    assert record['file_path'] == structlog_utils.file_path
+    # C3
+    for key, value in event_kwargs.items():
+        assert record[key] == value
+
+
+def test_StructlogUtils_gelf_renderer(structlog_utils, event_kwargs):
+    """
+    Tests if event dictionary is rendered into a GELF payload
+
+    # C1: Checks that mandatory GELF fields are populated
+    # C2: Checks that all logged metadata are declared as additional fields
+    # C3: Checks that the event is not duplicated as an additional field
+    # C4: Checks that non-string & missing events are rendered as non-empty 
+        string short messages
+    """
+    rendered = structlog_utils.gelf_renderer(
+        logger,
+        "info",
+        event_dict={'event': "Test event", 'level': "info", **event_kwargs}
+    )
+    gelf_dict = json.loads(rendered)
+    # C1
+    assert gelf_dict['version'] == "1.1"
+    assert gelf_dict['host']
+    assert gelf_dict['short_message'] == "Test event"
+    assert isinstance(gelf_dict['timestamp'], float)
+    assert gelf_dict['level'] == 6
+    # C2
+    for key, value in event_kwargs.items():
+        assert gelf_dict[f"_{key}"] == value
+    # C3
+    assert "_event" not in gelf_dict
+    # C4
+    for event, short_message in [
+        ({'a': 1}, "{'a': 1}"), 
+        (42, "42"), 
+        (None, "-")
+    ]:
+        event_dict = {'level': "info"} if event is None else {'event': event}
+        rendered = structlog_utils.gelf_renderer(logger, "info", event_dict)
+        assert json.loads(rendered)['short_message'] == short_message
+
+
+def test_StructlogUtils_gelf_fast_renderer(structlog_utils, event_kwargs):
+    """
+    Tests if the fused 'gelf' renderer stamps default metadata as GELF fields
+
+    # C1: Checks that the rendered output is a GELF payload of the event
+    # C2: Checks that default metadata is stamped as additional GELF fields
+    """
+    rendered = structlog_utils.gelf_fast_renderer(
+        logger,
+        "error",
+        event_dict={'event': "Test event", **event_kwargs}
+    )
+    gelf_dict = json.loads(rendered)
+    # C1
+    assert gelf_dict['short_message'] == "Test event"
+    assert gelf_dict['level'] == 3
+    # C2
+    assert gelf_dict['_level'] == "error"
+    assert gelf_dict['_level_number'] == logging.ERROR
+    assert isinstance(gelf_dict['_timestamp'], str)
+    assert gelf_dict['_file_path'] == structlog_utils.file_path
+
+
 def test_StructlogUtils_graypy_structlog_processor(
     structlog_utils, 
     event_kwargs
@@ -208,6 +700,7 @@ def test_StructlogUtils_graypy_structlog_processor(
 
     # C1: Check that the position-based arguments are formatted correct
     # c2: Check that keyword-based arguments are formatted correctly
+    # C3: Check that the keyword arguments template is reused per thread
     """
     args, kwargs = structlog_utils.graypy_structlog_processor(
         logger,
@@ -223,4 +716,12 @@ def test_StructlogUtils_graypy_structlog_processor(
         assert isinstance(cached_event_dict.get('process_name'), str)
         assert isinstance(cached_event_dict.get('thread_name'), str)
         assert isinstance(cached_event_dict.get('file'), str)
-        assert isinstance(cached_event_dict.get('function'), str)
\ No newline at end of file
+        assert isinstance(cached_event_dict.get('function'), str)
+    # C3
+    _, next_kwargs = structlog_utils.graypy_structlog_processor(
+        logger,
+        method,
+        event_dict={'event': "Next test event"}
+    )
+    assert next_kwargs is kwargs
+    assert next_kwargs['extra']['event'] == "Next test event"
\ No newline at end of file